@@ -0,0 +1,53 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Command_AL4_SETUP_CACHEBUDGET_Tests(t_utils.TestUtils):
+    async def test_run_command__setupCacheBudget(self):
+        """
+        - Show that no cache budget is set
+        - set the cache budget
+        - verify it is set
+        - remove it
+        - verify it is removed
+        """
+        async with self.getTestCoreWithPkg() as core:
+
+            # now setup user with perms
+            user = await core.auth.addUser("user")
+            await user.addRule((True, ("power-ups", "al4", "admin")))
+            await user.addRule((True, ("power-ups", "al4", "user")))
+
+            async with core.getLocalProxy(user="user") as asuser:
+                msgs = await asuser.storm("al4.setup.cachebudget").list()
+                self.stormIsInPrint("Usage: al4.setup.cachebudget [options]", msgs)
+
+                msgs = await asuser.storm("al4.setup.cachebudget --show").list()
+                self.stormIsInPrint("No Assemblyline cache budget is configured.", msgs)
+
+                msgs = await asuser.storm("al4.setup.cachebudget --max-axon-bytes 1073741824").list()
+                self.stormIsInPrint("Setting the Assemblyline cache budget for all users.", msgs)
+
+                msgs = await asuser.storm("al4.setup.cachebudget --show").list()
+                self.stormIsInPrint("Assemblyline cache budget: 1073741824 axon bytes per ontology results cache", msgs)
+
+                msgs = await asuser.storm("al4.setup.cachebudget --remove").list()
+                self.stormIsInPrint("Removing the Assemblyline cache budget.", msgs)
+
+                msgs = await asuser.storm("al4.setup.cachebudget --show").list()
+                self.stormIsInPrint("No Assemblyline cache budget is configured.", msgs)
+
+    async def test_run_command_Raises_BadArg(self):
+        """
+        Verify an invalid cache budget is not set
+        """
+        async with self.getTestCoreWithPkg() as core:
+            msgs = await core.stormlist("al4.setup.cachebudget --max-axon-bytes 0")
+            self.stormIsInErr("BadArg Exception - maxAxonBytes param expects an int greater than 0", msgs)
@@ -0,0 +1,62 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Command_AL4_SETUP_RATELIMIT_Tests(t_utils.TestUtils):
+    async def test_run_command__setupRateLimit(self):
+        """
+        - Show that no rate limit is set
+        - set the rate limits of the configured API host and of another host
+        - verify the rate limits are set
+        - remove a rate limit
+        - verify it is removed
+        """
+        async with self.getTestCoreWithPkg() as core:
+
+            # now setup user with perms
+            user = await core.auth.addUser("user")
+            await user.addRule((True, ("power-ups", "al4", "admin")))
+            await user.addRule((True, ("power-ups", "al4", "user")))
+
+            await core.callStorm('$lib.import(al4.setup.admin).setGlobalAPIHost("https://al4.local")')
+
+            async with core.getLocalProxy(user="user") as asuser:
+                msgs = await asuser.storm("al4.setup.ratelimit --show").list()
+                self.stormIsInPrint("No Assemblyline API rate limits are configured.", msgs)
+
+                msgs = await asuser.storm("al4.setup.ratelimit --endpoint search --rate 600 --burst 10").list()
+                self.stormIsInPrint("Setting the search rate limit of https://al4.local for all users.", msgs)
+
+                msgs = await asuser.storm("al4.setup.ratelimit --host https://al2.local --rate 60").list()
+                self.stormIsInPrint("Setting the default rate limit of https://al2.local for all users.", msgs)
+
+                msgs = await asuser.storm("al4.setup.ratelimit --show").list()
+                self.stormIsInPrint("https://al4.local search: 600 requests per minute, burst of 10", msgs)
+                self.stormIsInPrint("https://al2.local default: 60 requests per minute, burst of 1", msgs)
+
+                msgs = await asuser.storm("al4.setup.ratelimit --endpoint search --remove").list()
+                self.stormIsInPrint("Removing the search rate limit of https://al4.local.", msgs)
+
+                msgs = await asuser.storm("al4.setup.ratelimit --show").list()
+                self.stormNotInPrint("https://al4.local search", msgs)
+                self.stormIsInPrint("https://al2.local default: 60 requests per minute, burst of 1", msgs)
+
+    async def test_run_command_Raises_BadArg(self):
+        """
+        Verify an invalid endpoint class or rate is not set
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await core.callStorm('$lib.import(al4.setup.admin).setGlobalAPIHost("https://al4.local")')
+
+            msgs = await core.stormlist("al4.setup.ratelimit --endpoint foo --rate 600")
+            self.stormIsInErr("foo", msgs)
+
+            msgs = await core.stormlist("al4.setup.ratelimit --rate 0")
+            self.stormIsInErr("BadArg Exception - rate param expects an int greater than 0", msgs)
@@ -0,0 +1,53 @@
+import logging
+
+import pytest
+import json
+
+import synapse.exc as s_exc
+import synapse.lib.node as s_node
+import synapse.tests.utils as s_t_utils
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_al4_Tests(t_utils.TestUtils):
+    async def test__processOntologyResultLines(self):
+        """
+        Validate a list of ontology result lines is processed one line at a time
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """ 
+                $mod = $lib.import(al4)
+
+                for $n in $mod._processOntologyResultLines($raw_ont_result.split("\\n")) {
+                   yield $n
+                }
+                """
+
+            raw_result = self.getTestFileJsonAsRawOntologyResult(
+                "ontology_results/raw_ontresults.fileresult.multiple_results.json"
+            )
+
+            opts = {"vars": {"raw_ont_result": raw_result}}
+            nodes = await core.nodes(q, opts=opts)
+
+            expected = [
+                (
+                    "file:bytes",
+                    "sha256:76fcf3c26b464cfc30a40b78b7e6ac79034e31cf9fa377f81ee987a1a04e2b6a",
+                ),
+                ("inet:fqdn", "fonts.googleapis.com"),
+                ("inet:fqdn", "www.w3.org"),
+                ("inet:url", "https://fonts.googleapis.com"),
+                ("inet:url", "https://fonts.gstatic.com"),
+            ]
+
+            self.len(len(expected) + 1, nodes)
+
+            for nod in nodes:
+                self.isin(nod.ndef, expected)
@@ -60,6 +60,95 @@ class Module_al4_Tests(t_utils.TestUtils):
             for nod in nodes:
                 self.isin(nod.ndef, expected)
 
+    async def test__processRawOntologyResults_ingestState(self):
+        """
+        Validate results already modeled within the asof timeframe are lifted instead of being modeled again
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """ 
+                $mod = $lib.import(al4)
+
+                for $n in $mod._processRawOntologyResults($raw_ont_result, asof="-30days") {
+                   yield $n
+                }
+                """
+
+            raw_result = self.getTestFileJsonAsRawOntologyResult(
+                "ontology_results/raw_ontresults.fileresult.multiple_results.json"
+            )
+            opts = {"vars": {"raw_ont_result": raw_result}}
+
+            msgs = await core.stormlist(q, opts=opts)
+            first = [m[1][0] for m in msgs if m[0] == "node"]
+            self.len(6, first)
+            self.gt(len([m for m in msgs if m[0] == "node:edits"]), 0)
+
+            msgs = await core.stormlist(q, opts=opts)
+            second = [m[1][0] for m in msgs if m[0] == "node"]
+            self.eq(first, second)
+            self.len(0, [m for m in msgs if m[0] == "node:edits"])
+
+            # a modeled node was deleted so the results are modeled again
+            await core.nodes("inet:fqdn=www.w3.org | delnode --force")
+
+            msgs = await core.stormlist(q, opts=opts)
+            third = [m[1][0] for m in msgs if m[0] == "node"]
+            self.eq(first, third)
+            self.gt(len([m for m in msgs if m[0] == "node:edits"]), 0)
+
+    async def test__processRawOntologyResults_ingestState_modelVersion(self):
+        """
+        Validate results recorded by an older model version are modeled again instead of being lifted
+        """
+        async with self.getTestCoreWithPkg() as core:
+            raw_result = self.getTestFileJsonAsRawOntologyResult(
+                "ontology_results/raw_ontresults.fileresult.multiple_results.json"
+            )
+            opts = {"vars": {"raw_ont_result": raw_result}}
+
+            # record the results as modeled into an unrelated node, using the key of the previous model version
+            q = """
+                [ inet:fqdn=old.local ]
+                $idens = ($node.iden(),)
+
+                $privsepMod = $lib.import(al4.privsep)
+                $inputs = ($privsepMod.getTagPrefix(), $lib.pkg.get("usaa-assemblyline4").version, $lib.view.get().iden)
+
+                for $line in $raw_ont_result.split("\\n") {
+                    $l = $line.strip()
+                    if $l {
+                        $privsepMod.setIngestState($lib.guid($l, $inputs), $idens)
+                    }
+                }
+                """
+            await core.callStorm(q, opts=opts)
+
+            q = """
+                $mod = $lib.import(al4)
+
+                for $n in $mod._processRawOntologyResults($raw_ont_result, asof="-30days") {
+                   yield $n
+                }
+                """
+            nodes = await core.nodes(q, opts=opts)
+            self.len(6, nodes)
+            self.notin(("inet:fqdn", "old.local"), [nod.ndef for nod in nodes])
+
+            # the results are recorded with the current model version
+            q = """
+                $privsepMod = $lib.import(al4.privsep)
+                $inputs = (
+                    $privsepMod.getTagPrefix(),
+                    $lib.pkg.get("usaa-assemblyline4").version,
+                    $lib.import(al4.ingest).modelVersion,
+                    $lib.view.get().iden
+                )
+
+                $line = $raw_ont_result.split("\\n").0.strip()
+                return($privsepMod.getIngestState($lib.guid($line, $inputs)))
+                """
+            self.nn(await core.callStorm(q, opts=opts))
+
     async def test__processRawOntologyResults_emptyResults(self):
         """
         For empty results, verify no nodes are created and no errors
@@ -0,0 +1,103 @@
+import logging
+
+import pytest
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_al4_Tests(t_utils.TestUtils):
+    async def test__uniqNodes(self):
+        """
+        Validate each node is yielded once, in the order first seen
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await core.nodes("[ inet:fqdn=foo.local inet:fqdn=bar.local inet:fqdn=baz.local ]")
+
+            q = """
+                $mod = $lib.import(al4)
+
+                $nodes = $lib.list()
+                inet:fqdn=foo.local $nodes.append($node)
+                inet:fqdn=bar.local $nodes.append($node)
+                inet:fqdn=foo.local $nodes.append($node)
+                | spin |
+
+                $nodes.append($lib.null)
+
+                for $n in $mod._uniqNodes($nodes) {
+                    yield $n
+                }
+                """
+            nodes = await core.nodes(q)
+
+            self.eq(
+                [("inet:fqdn", "foo.local"), ("inet:fqdn", "bar.local")],
+                [nod.ndef for nod in nodes],
+            )
+
+    async def test__uniqNodes_sharedSeen(self):
+        """
+        Validate nodes already yielded from another source are skipped when the seen set is shared
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await core.nodes("[ inet:fqdn=foo.local inet:fqdn=bar.local inet:fqdn=baz.local ]")
+
+            q = """
+                $mod = $lib.import(al4)
+
+                $first = $lib.list()
+                $second = $lib.list()
+                inet:fqdn=foo.local $first.append($node)
+                inet:fqdn=bar.local $first.append($node)
+                inet:fqdn=bar.local $second.append($node)
+                inet:fqdn=baz.local $second.append($node)
+                | spin |
+
+                $seen = $lib.set()
+                $ndefs = $lib.list()
+
+                for $n in $mod._uniqNodes($first, seen=$seen) { $ndefs.append($n.ndef()) }
+                for $n in $mod._uniqNodes($second, seen=$seen) { $ndefs.append($n.ndef()) }
+
+                return(($ndefs, $seen.size()))
+                """
+            ndefs, size = await core.callStorm(q)
+
+            self.eq(
+                (
+                    ("inet:fqdn", "foo.local"),
+                    ("inet:fqdn", "bar.local"),
+                    ("inet:fqdn", "baz.local"),
+                ),
+                ndefs,
+            )
+            self.eq(3, size)
+
+    async def test__uniqNodes_yieldingFunction(self):
+        """
+        Validate the nodes of a function which yields nodes are de-duplicated
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await core.nodes("[ inet:fqdn=foo.local inet:fqdn=bar.local ]")
+
+            q = """
+                $mod = $lib.import(al4)
+
+                // the nodes of this function are iterated as (node, path) pairs
+                function liftTwice() {
+                    inet:fqdn=foo.local inet:fqdn=bar.local inet:fqdn=foo.local
+                }
+
+                for $n in $mod._uniqNodes($liftTwice()) {
+                    yield $n
+                }
+                """
+            nodes = await core.nodes(q)
+
+            self.eq(
+                [("inet:fqdn", "bar.local"), ("inet:fqdn", "foo.local")],
+                sorted(nod.ndef for nod in nodes),
+            )
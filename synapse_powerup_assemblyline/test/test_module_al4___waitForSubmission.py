@@ -0,0 +1,60 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_al4_Tests(t_utils.TestUtils):
+    """
+    NOTE: This has limited tests as the Assemblyline API is not being mocked
+
+    TODO: Future, mock AL4 api so the full method can be tested
+        e.g. cannot test a submission completing
+    """
+
+    async def test_waitForSubmission_noAPIHost(self):
+        """
+        Validate it gets to the point of checking the submission status and fails
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4)
+                return($mod._waitForSubmission("44A8cH7F03NSF6qqOWOktq", timeout=5))
+                """
+            with self.raises(s_exc.NeedConfValu) as exc:
+                await core.callStorm(q)
+            self.isin(
+                "NeedConfValu Exception - The Assemblyline API host is not configured. Run al4.setup.apihost",
+                exc.exception.get("mesg"),
+            )
+
+    async def test_waitForSubmission_timeout(self):
+        """
+        Validate a warning is shown and false is returned once the timeout is reached
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupMod = $lib.import(al4.setup.admin)
+                $setupMod.setGlobalAPIHost("al4.local")
+                $setupMod.setGlobalAPICreds("user", "key")
+                """
+            await core.nodes(q)
+
+            q = """
+                $mod = $lib.import(al4)
+                if (not $mod._waitForSubmission("44A8cH7F03NSF6qqOWOktq", timeout=2)) {
+                    $lib.print("not completed")
+                }
+                """
+            msgs = await core.stormlist(q)
+            self.stormIsInWarn("submission not completed within 2 seconds: 44A8cH7F03NSF6qqOWOktq", msgs)
+            self.stormIsInPrint("not completed", msgs)
+
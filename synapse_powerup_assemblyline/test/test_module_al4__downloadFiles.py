@@ -0,0 +1,106 @@
+import logging
+
+import pytest
+import json
+
+import synapse.exc as s_exc
+import synapse.lib.node as s_node
+import synapse.tests.utils as s_t_utils
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_al4_Tests(t_utils.TestUtils):
+    """
+    NOTE: This has limited tests as the Assemblyline API is not being mocked
+
+    TODO: Future, mock AL4 api so the full method can be tested
+        e.g. cannot test downloading files that are not in the axon
+    """
+
+    async def test_downloadFiles_filesInAxon(self):
+        """
+        input: list(file:bytes | hash:sha256)
+        Validate the file:bytes nodes are returned in the inbound order when the files are already in the axon
+        """
+        async with self.getTestCoreWithPkg() as core:
+            for byts in (b"asdf", b"qwer"):
+                opts = {"vars": {"obj": byts}}
+                await core.nodes("[ file:bytes=$obj ]", opts=opts)
+                await core.axon.put(byts)
+
+            sha256_1 = "f0e4c2f76c58916ec258f246851bea091d14d4247a2fc3e18694461b1816e13b"
+            sha256_2 = "f6f2ea8f45d8a057c9566a33f99474da2e5c6a6604d736121650e2730c6fb0a3"
+
+            for workers in (1, 2):
+                q = """
+                    $mod = $lib.import(al4)
+
+                    $nodes = $lib.list()
+                    file:bytes=$sha256_2 $nodes.append($node)
+                    [ hash:sha256=$sha256_1 ] $nodes.append($node)
+                    file:bytes=$sha256_2 $nodes.append($node)
+
+                    | spin |
+
+                    yield $mod.downloadFiles($nodes, workers=$workers)
+                    """
+                opts = {"vars": {"sha256_1": sha256_1, "sha256_2": sha256_2, "workers": workers}}
+                nodes = await core.nodes(q, opts=opts)
+
+                # debug
+                # for nod in nodes:
+                #    log.warning(nod.pack(dorepr=True))
+
+                # duplicates are only downloaded and yielded once
+                self.len(2, nodes)
+                self.eq(
+                    [
+                        ("file:bytes", f"sha256:{sha256_2}"),
+                        ("file:bytes", f"sha256:{sha256_1}"),
+                    ],
+                    [nod.ndef for nod in nodes],
+                )
+
+    async def test_downloadFiles_warn(self):
+        """
+        Validate a warning is returned for unsupported nodes
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4)
+
+                $nodes = $lib.list()
+                [ inet:fqdn=vertex.link ] $nodes.append($node)
+
+                | spin |
+
+                yield $mod.downloadFiles($nodes)
+                """
+            msgs = await core.stormlist(q)
+            self.stormIsInWarn("downloadFiles expected file:bytes or hash:sha256 node.", msgs)
+            self.len(0, [m for m in msgs if m[0] == "node"])
+
+
+class Command_AL4_FILE_DOWNLOAD_Tests(t_utils.TestUtils):
+    async def test_fileDownload_workers(self):
+        """
+        Validate al4.file.download passes the inbound nodes through when using --batch-size and --workers
+        """
+        async with self.getTestCoreWithPkg() as core:
+            for byts in (b"asdf", b"qwer"):
+                opts = {"vars": {"obj": byts}}
+                await core.nodes("[ file:bytes=$obj ]", opts=opts)
+                await core.axon.put(byts)
+
+            nodes = await core.nodes("file:bytes | al4.file.download --batch-size 10 --workers 2")
+            self.len(2, nodes)
+
+            nodes = await core.nodes("file:bytes | al4.file.download --batch-size 10 --workers 2 --yield")
+            self.len(2, nodes)
+            self.eq({"file:bytes"}, {nod.ndef[0] for nod in nodes})
@@ -0,0 +1,135 @@
+import logging
+
+import pytest
+import json
+
+import synapse.exc as s_exc
+import synapse.lib.node as s_node
+import synapse.tests.utils as s_t_utils
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_al4_Tests(t_utils.TestUtils):
+    async def test_enrichFiles(self):
+        """
+        Validate the analytical result nodes for every file in the batch are created and yielded.
+        """
+        async with self.getTestCoreWithPkg() as core:
+            sha256_1 = "76fcf3c26b464cfc30a40b78b7e6ac79034e31cf9fa377f81ee987a1a04e2b6a"
+            sha256_2 = "1a107c3ece1880cbc7b7ba3ff3a9e5d9e1a4c2ee87e5d5cd59c6f1e13d7dd4cb"
+            q = """ 
+                // Setup the cache for the test
+                $lib.jsonstor.cacheset(("power-ups","al4","cache","file","ontology"), $sha256_1, $raw_ont_result_1)
+                $lib.jsonstor.cacheset(("power-ups","al4","cache","file","ontology"), $sha256_2, $raw_ont_result_2)
+
+                $mod = $lib.import(al4)
+
+                $nodes = $lib.list()
+                [file:bytes=$sha256_1] $nodes.append($node)
+                [hash:sha256=$sha256_2] $nodes.append($node)
+                [hash:sha256=$sha256_1] $nodes.append($node)
+
+                | spin |
+
+                for $n in $mod.enrichFiles($nodes) {
+                    yield $n
+                }
+                """
+            raw_result_1 = self.getTestFileJsonAsRawOntologyResult(
+                "ontology_results/raw_ontresults.fileresult.multiple_results.json"
+            )
+            ontresult_2 = self.getTestFileJson(
+                "ontology_results/ontresult.fileresult.no_artifacts.json"
+            )
+            ontresult_2["file"]["sha256"] = sha256_2
+            raw_result_2 = json.dumps(ontresult_2) + "\n"
+
+            opts = {
+                "vars": {
+                    "raw_ont_result_1": raw_result_1,
+                    "raw_ont_result_2": raw_result_2,
+                    "sha256_1": sha256_1,
+                    "sha256_2": sha256_2,
+                }
+            }
+            nodes = await core.nodes(q, opts=opts)
+
+            expected = [
+                ("file:bytes", f"sha256:{sha256_1}"),
+                ("file:bytes", f"sha256:{sha256_2}"),
+                ("inet:fqdn", "fonts.googleapis.com"),
+                ("inet:fqdn", "www.w3.org"),
+                ("inet:url", "https://fonts.googleapis.com"),
+                ("inet:url", "https://fonts.gstatic.com"),
+            ]
+
+            self.len(len(expected), nodes)
+
+            # verify each node's ndef is found in the expected list
+            for nod in nodes:
+                self.isin(nod.ndef, expected)
+
+    async def test_enrichFiles_warnForImproperInputs(self):
+        """
+        validate than when a node other than file:bytes or hash:sha256 is specified, a
+        warning message is raised and no node is yielded
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """ 
+                $mod = $lib.import(al4)
+
+                $nodes = $lib.list()
+                [it:dev:str=1234] $nodes.append($node)
+                [file:bytes=*] $nodes.append($node)
+
+                | spin |
+
+                for $n in $mod.enrichFiles($nodes) {
+                    yield $n
+                }
+                """
+            msgs = await core.stormlist(q)
+            self.len(0, [m for m in msgs if m[0] == "node"])
+            self.stormIsInWarn(
+                "usaa-assemblyline4 - enrichFiles expected file:bytes or hash:sha256 node.",
+                msgs,
+            )
+            self.stormIsInWarn(
+                "usaa-assemblyline4 - sha256 not found on requested node.",
+                msgs,
+            )
+
+
+class Command_AL4_FILE_ENRICH_Tests(t_utils.TestUtils):
+    async def test_run_command__batchSize(self):
+        """
+        Validate files are enriched in batches and the inbound nodes are yielded by default
+        """
+        async with self.getTestCoreWithPkg() as core:
+            sha256 = "76fcf3c26b464cfc30a40b78b7e6ac79034e31cf9fa377f81ee987a1a04e2b6a"
+            q = """
+                $lib.jsonstor.cacheset(("power-ups","al4","cache","file","ontology"), $sha256, $raw_ont_result)
+            """
+            raw_result = self.getTestFileJsonAsRawOntologyResult(
+                "ontology_results/raw_ontresults.fileresult.multiple_results.json"
+            )
+            opts = {"vars": {"raw_ont_result": raw_result, "sha256": sha256}}
+            await core.callStorm(q, opts=opts)
+
+            nodes = await core.nodes(
+                "[hash:sha256=$sha256] | al4.file.enrich --batch-size 10", opts=opts
+            )
+            self.len(1, nodes)
+            self.eq(nodes[0].ndef, ("hash:sha256", sha256))
+
+            nodes = await core.nodes(
+                "[hash:sha256=$sha256] | al4.file.enrich --batch-size 10 --yield",
+                opts=opts,
+            )
+            self.len(5, nodes)
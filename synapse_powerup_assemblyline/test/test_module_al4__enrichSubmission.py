@@ -25,7 +25,8 @@ class Module_al4_Tests(t_utils.TestUtils):
             q = """ 
                 // Setup the cache for the test
                 $lib.jsonstor.cacheset(("power-ups","al4","cache","submission","tree"), $sid, $submission_tree_result)
-                $lib.jsonstor.cacheset(("power-ups","al4","cache","submission","ontology"), $sid, $raw_ont_result)
+                ($size, $sha256) = $lib.bytes.put($raw_ont_result.encode())
+                $lib.jsonstor.cacheset(("power-ups","al4","cache","submission","ontology"), $sid, ({"sha256": $sha256, "size": $size}))
             
                 $mod = $lib.import(al4)
                 
@@ -0,0 +1,78 @@
+import logging
+
+import pytest
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_al4_Tests(t_utils.TestUtils):
+    async def test_getCacheInfo(self):
+        """
+        Validate the cache details are returned
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $lib.jsonstor.cacheset(("power-ups", "al4", "cache", "submission", "tree"), "sid-1", ({"foo": "bar"}))
+
+                $mod = $lib.import(al4)
+                return($mod.getCacheInfo(path="submission/tree"))
+                """
+            info = await core.callStorm(q)
+
+            self.eq(["power-ups/al4/cache/submission/tree"], list(info.keys()))
+            self.eq(1, info["power-ups/al4/cache/submission/tree"].get("entries"))
+
+
+class Command_AL4_CACHE_STATS_Tests(t_utils.TestUtils):
+    async def test_run_command(self):
+        """
+        Verify the stats of each cache are printed
+        """
+        async with self.getTestCoreWithPkg() as core:
+            msgs = await core.stormlist("al4.cache.stats")
+            self.stormIsInPrint("No Assemblyline cache entries found.", msgs)
+
+            q = """
+                $mod = $lib.import(al4.privsep)
+
+                $treepath = ("power-ups", "al4", "cache", "submission", "tree")
+                $lib.jsonstor.cacheset($treepath, "sid-1", ({"foo": "bar"}))
+                $mod._getCache($treepath, "sid-1")
+                $mod._getCache($treepath, "sid-1")
+                $mod._getCache($treepath, "sid-1")
+                $mod._getCache($treepath, "sid-2")
+                $mod.flushCacheStats()
+                """
+            await core.callStorm(q)
+
+            msgs = await core.stormlist("al4.cache.stats")
+            self.stormIsInPrint("power-ups/al4/cache/submission/tree", msgs)
+            self.stormIsInPrint("entries: 1", msgs)
+            self.stormIsInPrint("hits: 3  misses: 1  hit ratio: 75.0%", msgs)
+            self.stormIsInPrint("cached within the last day: 1  week: 0  month: 0  older: 0", msgs)
+
+            # the ratio is rounded to one decimal
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod._getCache(("power-ups", "al4", "cache", "submission", "tree"), "sid-3")
+                $mod._getCache(("power-ups", "al4", "cache", "submission", "tree"), "sid-4")
+                $mod.flushCacheStats()
+                """
+            await core.callStorm(q)
+
+            msgs = await core.stormlist("al4.cache.stats")
+            self.stormIsInPrint("hits: 3  misses: 3  hit ratio: 50.0%", msgs)
+
+            await core.callStorm(
+                """
+                $mod = $lib.import(al4.privsep)
+                $mod._getCache(("power-ups", "al4", "cache", "submission", "tree"), "sid-1")
+                $mod.flushCacheStats()
+                """
+            )
+
+            msgs = await core.stormlist("al4.cache.stats")
+            self.stormIsInPrint("hits: 4  misses: 3  hit ratio: 57.1%", msgs)
@@ -0,0 +1,119 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_al4_Tests(t_utils.TestUtils):
+
+    """
+    NOTE: This has limited tests as the Assemblyline API is not being mocked
+
+    TODO: Future, mock AL4 api so the full method can be tested
+    """
+
+    async def test_iterSearchIndex_Raises_BadArg(self):
+        """
+        Test that BadArg is raised when missing or invalid input param
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4)
+                $inp = $lib.null
+                for $item in $mod.iterSearchIndex($inp, $inp) { }
+                """
+            with self.raises(s_exc.BadArg) as exc:
+                await core.callStorm(q)
+            self.isin(
+                "BadArg Exception - missing param: searchQuery",
+                exc.exception.get("mesg"),
+            )
+
+            q = """
+                $mod = $lib.import(al4)
+                $inp = $lib.null
+                for $item in $mod.iterSearchIndex("search", $inp) { }
+                """
+            with self.raises(s_exc.BadArg) as exc:
+                await core.callStorm(q)
+            self.isin(
+                "BadArg Exception - missing param: index",
+                exc.exception.get("mesg"),
+            )
+
+            q = """
+                $mod = $lib.import(al4)
+                $inp = (['field1', 'field2'])
+                for $item in $mod.iterSearchIndex("search", "submission", fields=$inp) { }
+                """
+            with self.raises(s_exc.BadArg) as exc:
+                await core.callStorm(q)
+            self.isin(
+                "BadArg Exception - fields param expects str",
+                exc.exception.get("mesg"),
+            )
+
+            for inp in (0, -1, "foo"):
+                q = """
+                    $mod = $lib.import(al4)
+                    for $item in $mod.iterSearchIndex("search", "submission", pageSize=$inp) { }
+                    """
+                with self.raises(s_exc.BadArg) as exc:
+                    await core.callStorm(q, opts={"vars": {"inp": inp}})
+                self.isin(
+                    "BadArg Exception - pageSize param expects an int greater than 0",
+                    exc.exception.get("mesg"),
+                )
+
+            for inp in (-1, "foo"):
+                q = """
+                    $mod = $lib.import(al4)
+                    for $item in $mod.iterSearchIndex("search", "submission", limit=$inp) { }
+                    """
+                with self.raises(s_exc.BadArg) as exc:
+                    await core.callStorm(q, opts={"vars": {"inp": inp}})
+                self.isin(
+                    "BadArg Exception - limit param expects an int of 0 or more",
+                    exc.exception.get("mesg"),
+                )
+
+    async def test_iterSearchIndex_limitReached(self):
+        """
+        Verify no search is made once the limit is reached
+        """
+        async with self.getTestCoreWithPkg() as core:
+            # the API host is not configured, so any search would raise NeedConfValu
+            q = """
+                $mod = $lib.import(al4)
+                $items = $lib.list()
+                for $item in $mod.iterSearchIndex("search", "submission", limit=0) {
+                    $items.append($item)
+                }
+                return($items)
+                """
+            self.eq((), await core.callStorm(q))
+
+    async def test_iterSearchIndex_Raises_NeedConfValu_for_no_api_host(self):
+        """
+        Verify Raises NeedConfValu when api host is not set
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4)
+                $inp = 'search'
+                for $item in $mod.iterSearchIndex($inp, $inp, limit=10, pageSize=5) { }
+                """
+            with self.raises(s_exc.NeedConfValu) as exc:
+                await core.callStorm(q)
+            self.isin(
+                "NeedConfValu Exception - The Assemblyline API host is not configured. Run al4.setup.apihost",
+                exc.exception.get("mesg"),
+            )
@@ -0,0 +1,64 @@
+import logging
+
+import pytest
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_al4_Tests(t_utils.TestUtils):
+    async def test_refreshHotFiles(self):
+        """
+        Validate nothing is refreshed when no file was requested
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4)
+                return($mod.refreshHotFiles(minHits=$lib.cast(int, 1)))
+                """
+            self.eq(0, await core.callStorm(q))
+
+    async def test_refreshHotFiles_hot(self):
+        """
+        Validate the stale results of a frequently requested file are fetched again
+
+        The Assemblyline API response is replayed from the testassets cassette of this test
+        """
+        async with self.getTestCoreWithPkg() as core:
+            sha256 = "76fcf3c26b464cfc30a40b78b7e6ac79034e31cf9fa377f81ee987a1a04e2b6a"
+            q = """
+                $setupMod = $lib.import(al4.setup.admin)
+                $setupMod.setGlobalAPIHost("https://al4.local")
+                $setupMod.setGlobalAPICreds("user", "key")
+
+                // results cached shortly before they expire
+                $cachepath = ("power-ups", "al4", "cache", "file", "ontology")
+                $lib.jsonstor.cacheset($cachepath, $sha256, "{}")
+                for ($path, $entry) in $lib.jsonstor.iter(path=$cachepath) {
+                    $entrypath = $lib.list()
+                    $entrypath.extend($cachepath)
+                    $entrypath.extend($path)
+                }
+                $lib.jsonstor.set($entrypath, $lib.cast(time, "-29days"), prop=asof)
+
+                $privsepMod = $lib.import(al4.privsep)
+                for $i in $lib.range(3) {
+                    $privsepMod.getFilesOntologyResults(($sha256,))
+                }
+                $privsepMod.flushCacheStats()
+                """
+            await core.callStorm(q, opts={"vars": {"sha256": sha256}})
+
+            q = """
+                $mod = $lib.import(al4)
+                $refreshed = $mod.refreshHotFiles()
+
+                $cachepath = ("power-ups", "al4", "cache", "file", "ontology")
+                return(($refreshed, $lib.jsonstor.cacheget($cachepath, $sha256, asof="-1hour")))
+                """
+            refreshed, cached = await core.callStorm(q, opts={"vars": {"sha256": sha256}})
+
+            self.eq(1, refreshed)
+            self.nn(cached)
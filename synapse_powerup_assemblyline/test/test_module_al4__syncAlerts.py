@@ -0,0 +1,85 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_al4_Tests(t_utils.TestUtils):
+    """
+    NOTE: This has limited tests as the Assemblyline API is not being mocked
+
+    TODO: Future, mock AL4 api so the full method can be tested
+        e.g. cannot test grouping the alerts by sid and advancing the cursor after each batch
+    """
+
+    async def test_syncAlerts_Raises_BadArg(self):
+        """
+        Test that BadArg is raised when the batch size is invalid
+        """
+        async with self.getTestCoreWithPkg() as core:
+            for inp in (0, "foo"):
+                q = """
+                    $mod = $lib.import(al4)
+                    yield $mod.syncAlerts(batchSize=$inp)
+                    """
+                with self.raises(s_exc.BadArg) as exc:
+                    await core.nodes(q, opts={"vars": {"inp": inp}})
+                self.isin(
+                    "BadArg Exception - batchSize param expects an int greater than 0",
+                    exc.exception.get("mesg"),
+                )
+
+    async def test_syncAlerts_noAPIHost(self):
+        """
+        Validate it gets to the point of searching the alerts and fails
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4)
+                yield $mod.syncAlerts()
+                """
+            with self.raises(s_exc.NeedConfValu) as exc:
+                await core.nodes(q)
+            self.isin(
+                "NeedConfValu Exception - The Assemblyline API host is not configured. Run al4.setup.apihost",
+                exc.exception.get("mesg"),
+            )
+
+    async def test_syncAlerts_searchFailed(self):
+        """
+        Validate the cursor is not advanced when the search fails
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupMod = $lib.import(al4.setup.admin)
+                $setupMod.setGlobalAPIHost("al4.local")
+                $setupMod.setGlobalAPICreds("user", "key")
+
+                $privsepMod = $lib.import(al4.privsep)
+                $privsepMod.setSyncState("alert", ({"cursor": "2023-05-09T00:00:00.000000Z"}))
+                """
+            await core.nodes(q)
+
+            msgs = await core.stormlist('al4.alerts.sync --query "al.score:>=1000" --batch-size 10')
+            self.stormIsInWarn(
+                "alert sync failed, the cursor was not advanced past 2023-05-09T00:00:00.000000Z", msgs
+            )
+
+            msgs = await core.stormlist("al4.alerts.sync --reset --start 2023-05-01")
+            self.stormIsInWarn(
+                "alert sync failed, the cursor was not advanced past 2023-05-01T00:00:00.000000Z", msgs
+            )
+
+            q = """
+                $privsepMod = $lib.import(al4.privsep)
+                return($privsepMod.getSyncState("alert"))
+                """
+            self.eq({"cursor": "2023-05-09T00:00:00.000000Z"}, await core.callStorm(q))
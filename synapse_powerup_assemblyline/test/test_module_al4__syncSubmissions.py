@@ -0,0 +1,64 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_al4_Tests(t_utils.TestUtils):
+    """
+    NOTE: This has limited tests as the Assemblyline API is not being mocked
+
+    TODO: Future, mock AL4 api so the full method can be tested
+        e.g. cannot test advancing the watermark after modeling the results of the submissions
+    """
+
+    async def test_syncSubmissions_noAPIHost(self):
+        """
+        Validate it gets to the point of searching the submissions and fails
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4)
+                yield $mod.syncSubmissions()
+                """
+            with self.raises(s_exc.NeedConfValu) as exc:
+                await core.nodes(q)
+            self.isin(
+                "NeedConfValu Exception - The Assemblyline API host is not configured. Run al4.setup.apihost",
+                exc.exception.get("mesg"),
+            )
+
+    async def test_syncSubmissions_searchFailed(self):
+        """
+        Validate the watermark is not advanced when the search fails
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupMod = $lib.import(al4.setup.admin)
+                $setupMod.setGlobalAPIHost("al4.local")
+                $setupMod.setGlobalAPICreds("user", "key")
+
+                $privsepMod = $lib.import(al4.privsep)
+                $privsepMod.setSyncState("submission", ({"watermark": 1683590400000}))
+                """
+            await core.nodes(q)
+
+            msgs = await core.stormlist("al4.submission.sync --max-score 1000")
+            self.stormIsInWarn("submission sync failed, the watermark was not advanced", msgs)
+
+            msgs = await core.stormlist("al4.submission.sync --reset")
+            self.stormIsInWarn("submission sync failed, the watermark was not advanced", msgs)
+
+            q = """
+                $privsepMod = $lib.import(al4.privsep)
+                return($privsepMod.getSyncState("submission"))
+                """
+            self.eq({"watermark": 1683590400000}, await core.callStorm(q))
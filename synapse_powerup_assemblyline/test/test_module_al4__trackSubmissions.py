@@ -0,0 +1,93 @@
+import logging
+
+import pytest
+import json
+
+import synapse.exc as s_exc
+import synapse.lib.node as s_node
+import synapse.tests.utils as s_t_utils
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_al4_Tests(t_utils.TestUtils):
+    """
+    NOTE: This has limited tests as the Assemblyline API is not being mocked
+
+    TODO: Future, mock AL4 api so the full method can be tested
+        e.g. cannot test modeling the results of a completed submission
+    """
+
+    async def test_trackSubmissions_nothingQueued(self):
+        """
+        Validate nothing is yielded and no API call is made when no submissions are queued
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4)
+                yield $mod.trackSubmissions()
+                """
+            nodes = await core.nodes(q)
+            self.len(0, nodes)
+
+    async def test_trackSubmissions_noAPIHost(self):
+        """
+        Validate it gets to the point of checking the submission status and fails
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $privsepMod = $lib.import(al4.privsep)
+                $privsepMod.addPendingSubmission("44A8cH7F03NSF6qqOWOktq")
+
+                $mod = $lib.import(al4)
+                yield $mod.trackSubmissions()
+                """
+            with self.raises(s_exc.NeedConfValu) as exc:
+                await core.nodes(q)
+            self.isin(
+                "NeedConfValu Exception - The Assemblyline API host is not configured. Run al4.setup.apihost",
+                exc.exception.get("mesg"),
+            )
+
+    async def test_trackSubmissions_expire(self):
+        """
+        Validate incomplete submissions stay queued until they expire
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupMod = $lib.import(al4.setup.admin)
+                $setupMod.setGlobalAPIHost("al4.local")
+                $setupMod.setGlobalAPICreds("user", "key")
+
+                $privsepMod = $lib.import(al4.privsep)
+                $privsepMod.addPendingSubmission("44A8cH7F03NSF6qqOWOktq")
+                $privsepMod.addPendingSubmission("5fT3s9MUD0oOHMRm1a2K7b")
+                """
+            await core.nodes(q)
+
+            q = """
+                $mod = $lib.import(al4)
+                yield $mod.trackSubmissions(expire=$expire)
+
+                | spin |
+
+                $privsepMod = $lib.import(al4.privsep)
+                return($privsepMod.getPendingSubmissions().size())
+                """
+            opts = {"vars": {"expire": "-1day"}}
+            self.eq(2, await core.callStorm(q, opts=opts))
+
+            msgs = await core.stormlist("al4.submission.track --expire now")
+            self.stormIsInWarn("submission not completed in time, no longer tracking: 44A8cH7F03NSF6qqOWOktq", msgs)
+            self.stormIsInWarn("submission not completed in time, no longer tracking: 5fT3s9MUD0oOHMRm1a2K7b", msgs)
+
+            q = """
+                $privsepMod = $lib.import(al4.privsep)
+                return($privsepMod.getPendingSubmissions().size())
+                """
+            self.eq(0, await core.callStorm(q))
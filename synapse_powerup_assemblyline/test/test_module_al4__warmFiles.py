@@ -0,0 +1,101 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_al4_Tests(t_utils.TestUtils):
+
+    """
+    NOTE: This has limited tests as the Assemblyline API is not being mocked
+
+    TODO: Future, mock AL4 api so the full method can be tested
+    """
+
+    async def test_warmFiles_cached(self):
+        """
+        Validate cached files are counted without modeling them or counting them as requested
+        """
+        async with self.getTestCoreWithPkg() as core:
+            sha256 = "76fcf3c26b464cfc30a40b78b7e6ac79034e31cf9fa377f81ee987a1a04e2b6a"
+            q = """
+                $lib.jsonstor.cacheset(("power-ups", "al4", "cache", "file", "ontology"), $sha256, $raw_ont_result)
+
+                $mod = $lib.import(al4)
+
+                $nodes = $lib.list()
+                [file:bytes=$sha256] $nodes.append($node)
+                [hash:sha256=$sha256] $nodes.append($node)
+                [inet:fqdn=foo.local] $nodes.append($node)
+                | spin |
+
+                $cached = $mod.warmFiles($nodes)
+                $access = $lib.list()
+                for $item in $lib.jsonstor.iter(path=("power-ups", "al4", "access", "file.ontology")) {
+                    $access.append($item)
+                }
+
+                return(($cached, $access))
+                """
+            opts = {
+                "vars": {
+                    "sha256": sha256,
+                    "raw_ont_result": self.getTestFileJsonAsRawOntologyResult(
+                        "ontology_results/raw_ontresults.fileresult.multiple_results.json"
+                    ),
+                }
+            }
+            cached, access = await core.callStorm(q, opts=opts)
+
+            self.eq(1, cached)
+            self.eq([], access)
+
+            # the results were not modeled
+            self.len(0, await core.nodes("it:app:yara:match"))
+
+    async def test_warmFiles_Raises_NeedConfValu_for_no_api_host(self):
+        """
+        Validate the results of files that are not cached are requested
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4)
+
+                $nodes = $lib.list()
+                [hash:sha256=76fcf3c26b464cfc30a40b78b7e6ac79034e31cf9fa377f81ee987a1a04e2b6a] $nodes.append($node)
+                | spin |
+
+                return($mod.warmFiles($nodes))
+                """
+            with self.raises(s_exc.NeedConfValu) as exc:
+                await core.callStorm(q)
+            self.isin(
+                "NeedConfValu Exception - The Assemblyline API host is not configured. Run al4.setup.apihost",
+                exc.exception.get("mesg"),
+            )
+
+
+class Command_AL4_CACHE_WARM_Tests(t_utils.TestUtils):
+    async def test_run_command(self):
+        """
+        Verify the inbound nodes are passed through and --hot prints the number of refreshed files
+        """
+        async with self.getTestCoreWithPkg() as core:
+            sha256 = "76fcf3c26b464cfc30a40b78b7e6ac79034e31cf9fa377f81ee987a1a04e2b6a"
+            q = """
+                $lib.jsonstor.cacheset(("power-ups", "al4", "cache", "file", "ontology"), $sha256, "{}")
+                """
+            await core.callStorm(q, opts={"vars": {"sha256": sha256}})
+
+            nodes = await core.nodes(f"[file:bytes={sha256}] | al4.cache.warm")
+            self.len(1, nodes)
+            self.eq(("file:bytes", f"sha256:{sha256}"), nodes[0].ndef)
+
+            msgs = await core.stormlist("al4.cache.warm --hot")
+            self.stormIsInPrint("Refreshed the cached results of 0 frequently enriched files.", msgs)
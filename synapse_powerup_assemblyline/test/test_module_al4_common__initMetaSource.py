@@ -27,3 +27,32 @@ class Module_common_Tests(t_utils.TestUtils):
             self.len(1, valu)
             self.eq("usaa-assemblyline4", valu[0].props.get("name"))
             self.eq("usaa-assemblyline4", valu[0].props.get("type"))
+
+    async def test_getMetaSource_resolvedOnce(self):
+        """
+        verify the meta:source node is only edited on the first call
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """ 
+                $mod = $lib.import(al4.common)
+                $mod.getMetaSource()
+
+                // changes made after the first call are not overwritten
+                meta:source=be0d2eac8fdcbc2828a4e8fb375560a6 [ :name=changed ]
+
+                | spin |
+
+                return($mod.getMetaSource().props.name)
+                """
+            valu = await core.callStorm(q)
+            self.eq("changed", valu)
+
+            msgs = await core.stormlist("""
+                $mod = $lib.import(al4.common)
+                for $i in $lib.range(10) {
+                    [ inet:fqdn=$lib.str.format("{i}.vertex.link", i=$i) <(seen)+ { yield $mod.getMetaSource() } ]
+                }
+                """)
+            self.len(0, [m for m in msgs if m[0] == "err"])
+            nodes = await core.nodes("meta:source=be0d2eac8fdcbc2828a4e8fb375560a6 -(seen)> inet:fqdn")
+            self.len(10, nodes)
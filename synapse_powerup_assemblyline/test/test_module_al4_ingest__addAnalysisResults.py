@@ -94,7 +94,9 @@ class Module_ingest_Tests(t_utils.TestUtils):
             # missing sha256 prop in input dict
             q = """ 
                 $mod = $lib.import(al4.ingest)
-                return($mod.addAnalysisResults($ont_result_dict))
+                for $n in $mod.addAnalysisResults($ont_result_dict) {
+                    yield $n
+                }
                 """
             opts = {"vars": {"ont_result_dict": {"odm_version": "2.0"}}}
 
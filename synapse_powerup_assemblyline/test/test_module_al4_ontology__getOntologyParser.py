@@ -35,6 +35,23 @@ class Module_ontology_Tests(t_utils.TestUtils):
             self.nn(valu)
             self.eq("v1x", valu)
 
+    async def test_getOntologyParser_importedOnce(self):
+        """
+        Validate that the same parser module is returned for every version sharing a prefix
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.ontology)
+
+                $first = $mod.getOntologyParser("1.3")
+                $second = $mod.getOntologyParser("1.3")
+                $minor = $mod.getOntologyParser("1.4")
+
+                return((($first = $second), ($first = $minor)))
+                """
+            valu = await core.callStorm(q)
+            self.eq((True, True), valu)
+
     async def test_raises_NoSuchImpl(self):
         """
         Validate that NoSuchImpl exception is raised
@@ -263,3 +263,46 @@ class Module_ontology_v1x_Tests(t_utils.TestUtils):
             nodes = await core.nodes(q, opts=opts)
 
             self.len(0, nodes)
+
+    async def test_addDynamicIPs_hostProcEditedOnce(self):
+        """
+        Validate the it:host and it:exec:proc are only edited the first time a file is seen by the module.
+
+        Their props are removed between two calls, so they are only set again if the nodes are edited again.
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.ontology.v1x)
+
+                for $n in $mod.addDynamicIPs($ont_result_dict) { }
+
+                it:host [ -:desc ] | spin |
+                it:exec:proc [ -:sandbox:file ] | spin |
+
+                for $n in $mod.addDynamicIPs($ont_result_dict) { }
+                """
+            opts = {
+                "vars": {
+                    "ont_result_dict": self.getTestFileJson(
+                        "ontology_results/ontresult.submission.foosvc.json"
+                    )
+                }
+            }
+            await core.nodes(q, opts=opts)
+
+            nodes = await core.nodes("it:host")
+            self.len(1, nodes)
+            self.none(nodes[0].get("desc"))
+
+            nodes = await core.nodes("it:exec:proc")
+            self.len(1, nodes)
+            self.none(nodes[0].get("sandbox:file"))
+
+            # a new import of the module edits them again
+            await core.nodes(
+                "for $n in $lib.import(al4.ontology.v1x).addDynamicIPs($ont_result_dict) { }",
+                opts=opts,
+            )
+
+            nodes = await core.nodes("it:host")
+            self.eq("Assemblyline 4 Results", nodes[0].get("desc"))
@@ -0,0 +1,113 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+import synapse.common as s_common
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_ontology_v1x_Tests(t_utils.TestUtils):
+    async def test_addTagResults(self):
+        """
+        Validate each tag family present in the ontology result is routed to its handler
+        """
+        async with self.getTestCoreWithPkg() as core:
+            opts = {
+                "vars": {
+                    "ont_result_dict": self.getTestFileJson(
+                        "ontology_results/ontresult.submission.foosvc.json"
+                    )
+                }
+            }
+
+            q = """
+                $mod = $lib.import(al4.ontology.v1x)
+
+                for $n in $mod.addTagResults($ont_result_dict) {
+                    yield $n
+                }
+                """
+            nodes = await core.nodes(q, opts=opts)
+
+            # debug
+            # for nod in nodes:
+            #    log.warn(nod.pack(dorepr=True))
+
+            # the same nodes are returned when calling every tag handler directly
+            q = """
+                $mod = $lib.import(al4.ontology.v1x)
+
+                $nodes = $lib.list()
+                $handlers = (
+                    $mod.addFilepathFromTags,
+                    $mod.addYaraHits,
+                    $mod.addPasswords,
+                    $mod.addEmailAddrs,
+                    $mod.addStaticDomains,
+                    $mod.addStaticIPs,
+                    $mod.addStaticURIs,
+                    $mod.addUserAgents,
+                    $mod.addDynamicDomains,
+                    $mod.addDynamicIPs,
+                    $mod.addDynamicURIs
+                )
+                for $handler in $handlers {
+                    for $n in $handler($ont_result_dict) {
+                        $nodes.append($n)
+                    }
+                }
+
+                yield $nodes
+                """
+            expected = [nod.ndef for nod in await core.nodes(q, opts=opts)]
+
+            self.len(21, nodes)
+            self.sorteq(expected, [nod.ndef for nod in nodes])
+
+            # only the tags present are modeled
+            forms = set(nod.ndef[0] for nod in nodes)
+            self.notin("file:bytes", forms)
+            self.isin("it:app:yara:match", forms)
+            self.isin("inet:flow", forms)
+
+    async def test_addTagResults_noTags(self):
+        """
+        Validate no nodes are created when no handled tags are present in the ontology result
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.ontology.v1x)
+
+                for $n in $mod.addTagResults($ont_result_dict) {
+                    yield $n
+                }
+                """
+            opts = {
+                "vars": {
+                    "ont_result_dict": self.getTestFileJson(
+                        "ontology_results/ontresult.fileresult.no_artifacts.json"
+                    )
+                }
+            }
+            nodes = await core.nodes(q, opts=opts)
+
+            self.len(0, nodes)
+
+            # unknown tags are skipped
+            opts = {
+                "vars": {
+                    "ont_result_dict": {
+                        "file": {"sha256": "75899c5ace600406503a937ef550ab0bbd0f6e0188b9e93e206beb1dfc79bb81"},
+                        "results": {"tags": {"technique.packer": ["UPX"], "foo.bar": ["baz"]}},
+                    }
+                }
+            }
+            nodes = await core.nodes(q, opts=opts)
+
+            self.len(0, nodes)
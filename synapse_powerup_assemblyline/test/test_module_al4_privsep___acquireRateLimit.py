@@ -0,0 +1,81 @@
+import logging
+
+import pytest
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test__acquireRateLimit(self):
+        """
+        Validate the burst is taken at once and the next call waits for the bucket to be refilled
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupAdminMod = $lib.import(al4.setup.admin)
+                $setupAdminMod.setGlobalAPIHost("https://al4.local")
+                $setupAdminMod.setGlobalRateLimit("https://al4.local", "search", 60, burst=2)
+
+                $mod = $lib.import(al4.privsep)
+
+                $start = $lib.time.now()
+                $mod._acquireRateLimit("search")
+                $mod._acquireRateLimit("search")
+                $burst = ($lib.time.now() - $start)
+
+                $mod._acquireRateLimit("search")
+                $waited = ($lib.time.now() - $start)
+
+                $bucket = $lib.jsonstor.get(("power-ups", "al4", "ratelimit", $lib.guid("https://al4.local"), "search"))
+
+                return(($burst, $waited, $bucket))
+                """
+            burst, waited, bucket = await core.callStorm(q)
+
+            self.lt(burst, 1000)
+            self.ge(waited, 1000)
+            self.lt(bucket.get("tokens"), 1000)
+
+    async def test__acquireRateLimit_notConfigured(self):
+        """
+        Validate calls are not held, even by a paused bucket, when no limit is configured
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupAdminMod = $lib.import(al4.setup.admin)
+                $setupAdminMod.setGlobalAPIHost("https://al4.local")
+
+                $mod = $lib.import(al4.privsep)
+                $mod._setRetryAfter("search", 30)
+
+                $start = $lib.time.now()
+                for $i in $lib.range(10) {
+                    $mod._acquireRateLimit("search")
+                }
+
+                return(($lib.time.now() - $start))
+                """
+            self.lt(await core.callStorm(q), 1000)
+
+    async def test__acquireRateLimit_retryAfter(self):
+        """
+        Validate calls are held while the bucket is paused by a Retry-After response
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupAdminMod = $lib.import(al4.setup.admin)
+                $setupAdminMod.setGlobalAPIHost("https://al4.local")
+                $setupAdminMod.setGlobalRateLimit("https://al4.local", "default", 600, burst=10)
+
+                $mod = $lib.import(al4.privsep)
+                $mod._setRetryAfter("submit", 1)
+
+                $start = $lib.time.now()
+                $mod._acquireRateLimit("submit")
+
+                return(($lib.time.now() - $start))
+                """
+            self.ge(await core.callStorm(q), 900)
@@ -0,0 +1,96 @@
+import hashlib
+import logging
+
+import pytest
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def _cacheResults(self, core, keys):
+        """
+        Cache 13 bytes of ontology results in the axon per key with _setOntologyCache(), one key per query
+        """
+        q = """
+            $mod = $lib.import(al4.privsep)
+
+            ($size, $sha256) = $lib.bytes.put($lib.str.format("results-{key}", key=$key).encode())
+            $resp = ({"code": 200, "size": $size, "hashes": ({"sha256": $sha256})})
+
+            $mod._setOntologyCache(("power-ups", "al4", "cache", "file", "ontology"), $key, $resp)
+            """
+        for key in keys:
+            await core.callStorm(q, opts={"vars": {"key": key}})
+
+    async def _getCacheKeys(self, core):
+        q = """
+            $keys = $lib.list()
+            for ($path, $entry) in $lib.jsonstor.iter(path=("power-ups", "al4", "cache", "file", "ontology")) {
+                $keys.append($entry.key)
+            }
+            return($keys)
+            """
+        return sorted(await core.callStorm(q))
+
+    async def test__evictOntologyCache(self):
+        """
+        Validate the least recently used results are evicted from the jsonstor and the axon when new results are
+        cached beyond the cache budget
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await core.callStorm("$lib.import(al4.setup.admin).setGlobalCacheBudget(30)")
+
+            await self._cacheResults(core, ("key-1", "key-2"))
+
+            # key-1 is requested after key-2 is cached
+            q = """
+                $keys = ("key-1",)
+                $lib.jsonstor.set(("power-ups", "al4", "access", "file.ontology", $lib.guid()),
+                    ({"time": $lib.time.now(), "keys": $keys}))
+                """
+            await core.callStorm(q)
+
+            await self._cacheResults(core, ("key-3",))
+
+            self.eq(["key-1", "key-3"], await self._getCacheKeys(core))
+
+            q = """
+                return($lib.bytes.has($sha256))
+                """
+            sha256 = hashlib.sha256(b"results-key-2").hexdigest()
+            self.false(await core.callStorm(q, opts={"vars": {"sha256": sha256}}))
+
+    async def test__evictOntologyCache_sameQuery(self):
+        """
+        Validate the axon bytes of the cache are tracked for the rest of the query after they are read
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $lib.import(al4.setup.admin).setGlobalCacheBudget(30)
+
+                $mod = $lib.import(al4.privsep)
+                for $key in ("key-1", "key-2", "key-3", "key-4") {
+                    ($size, $sha256) = $lib.bytes.put($lib.str.format("results-{key}", key=$key).encode())
+                    $resp = ({"code": 200, "size": $size, "hashes": ({"sha256": $sha256})})
+
+                    $mod._setOntologyCache(("power-ups", "al4", "cache", "file", "ontology"), $key, $resp)
+
+                    // the entries are cached in order
+                    $lib.time.sleep(0.01)
+                }
+                """
+            await core.callStorm(q)
+
+            self.eq(["key-3", "key-4"], await self._getCacheKeys(core))
+
+    async def test__evictOntologyCache_noBudget(self):
+        """
+        Validate nothing is evicted when no cache budget is configured
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await self._cacheResults(core, ("key-1", "key-2", "key-3"))
+
+            self.eq(["key-1", "key-2", "key-3"], await self._getCacheKeys(core))
@@ -0,0 +1,93 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test__getConfig(self):
+        """
+        Validate the configuration is read once and reused for the rest of the query
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """ 
+                $setupMod = $lib.import(al4.setup.admin)
+                $setupMod.setGlobalAPIHost("al4.local")
+                $setupMod.setGlobalAPICreds("userx", "keyx")
+                $setupMod.setGlobalProxy("socks5://proxy.local:8888")
+
+                $mod = $lib.import(al4.privsep)
+                $config = ({
+                    "host": $mod._getConfig("host"),
+                    "creds": $mod._getConfig("creds"),
+                    "proxy": $mod._getConfig("proxy"),
+                    "tagPrefix": $mod._getConfig("tagPrefix"),
+                })
+
+                // changes made during the query are not picked up by the snapshot
+                $setupMod.setGlobalAPIHost("al4-changed.local")
+
+                return (($config, $mod._getAPIHost()))
+                """
+            config, host = await core.callStorm(q)
+            self.eq("al4.local", config.get("host"))
+            self.eq({"user": "userx", "key": "keyx", "scope": "global"}, config.get("creds"))
+            self.eq("socks5://proxy.local:8888", config.get("proxy"))
+            self.eq("rep.assemblyline", config.get("tagPrefix"))
+            self.eq("al4.local", host)
+
+            # a new query reads the configuration again
+            q = """ 
+                $mod = $lib.import(al4.privsep)
+                return ($mod._getAPIHost())
+                """
+            self.eq("al4-changed.local", await core.callStorm(q))
+
+    async def test__getConfig_userCreds(self):
+        """
+        Validate the API creds of the current user are used over the global creds
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """ 
+                $setupAdminMod = $lib.import(al4.setup.admin)
+                $setupAdminMod.setGlobalAPICreds("userx", "keyx")
+
+                $setupUserMod = $lib.import(al4.setup.user)
+                $setupUserMod.setUserAPICreds("usery", "keyy")
+
+                $mod = $lib.import(al4.privsep)
+                return ($mod._getConfig("creds"))
+                """
+            valu = await core.callStorm(q)
+            self.eq({"user": "usery", "key": "keyy", "scope": "current-user"}, valu)
+
+    async def test__getConfig_copy(self):
+        """
+        Validate changes made to a returned value are not seen by the rest of the query
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupMod = $lib.import(al4.setup.admin)
+                $setupMod.setGlobalAPIHost("https://al4.local")
+                $setupMod.setGlobalAPICreds("userx", "keyx")
+                $setupMod.setGlobalRateLimit("https://al4.local", "search", 600)
+
+                $mod = $lib.import(al4.privsep)
+
+                $creds = $mod._getConfig("creds")
+                $creds.user = "changed"
+
+                $rateLimits = $mod._getConfig("rateLimits")
+                $rateLimits."https://al4.local".search.rate = 1
+
+                return (($mod._getAPICreds().user, $mod._getRateLimit("search").rate))
+                """
+            user, rate = await core.callStorm(q)
+            self.eq("userx", user)
+            self.eq(600, rate)
@@ -0,0 +1,78 @@
+import logging
+
+import pytest
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test__getNegativeCache(self):
+        """
+        Validate a cached 404 response is returned, per endpoint, and is skipped with asof=now
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod._setNegativeCache("file.ontology", "foo", $lib.cast(int, 404))
+
+                return((
+                    $mod._getNegativeCache("file.ontology", "foo"),
+                    $mod._getNegativeCache("file.download", "foo"),
+                    $mod._getNegativeCache("file.ontology", "bar"),
+                    $mod._getNegativeCache("file.ontology", "foo", asof=now),
+                ))
+                """
+            self.eq((404, None, None, None), await core.callStorm(q))
+
+    async def test__getNegativeCache_expires(self):
+        """
+        Validate a negative response older than the negative cache timeframe is not used, even when asof is older
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod._setNegativeCache("file.ontology", "foo", $lib.cast(int, 404))
+
+                // backdate the cached response
+                $cachepath = ("power-ups", "al4", "cache", "negative", "file.ontology")
+                for ($path, $entry) in $lib.jsonstor.iter(path=$cachepath) {
+                    if ($entry.key = "foo") {
+                        $entrypath = $lib.list()
+                        $entrypath.extend($cachepath)
+                        $entrypath.extend($path)
+                    }
+                }
+                $lib.jsonstor.set($entrypath, $lib.cast(time, "-2days"), prop=asof)
+
+                return((
+                    $mod._getNegativeCache("file.ontology", "foo", asof="-30days"),
+                    $mod._getNegativeCache("file.ontology", "foo", asof="-3days"),
+                ))
+                """
+            self.eq((None, None), await core.callStorm(q))
+
+    async def test__getNegativeCache_skipsAPICall(self):
+        """
+        Validate a cached 404 response is returned without calling the Assemblyline API
+        """
+        async with self.getTestCoreWithPkg() as core:
+            # the API host is not configured, so any API call would raise NeedConfValu
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod._setNegativeCache("file.ontology", "75899c5ace600406503a937ef550ab0bbd0f6e0188b9e93e206beb1dfc79bb81", $lib.cast(int, 404))
+                $mod._setNegativeCache("file.download", "75899c5ace600406503a937ef550ab0bbd0f6e0188b9e93e206beb1dfc79bb81", $lib.cast(int, 404))
+                $mod._setNegativeCache("file.children", "75899c5ace600406503a937ef550ab0bbd0f6e0188b9e93e206beb1dfc79bb81", $lib.cast(int, 403))
+                $mod._setNegativeCache("submission.tree", "bar", $lib.cast(int, 404))
+
+                return((
+                    $mod.getFileOntologyResults("75899c5ace600406503a937ef550ab0bbd0f6e0188b9e93e206beb1dfc79bb81"),
+                    $mod.getFilesOntologyResults(("75899c5ace600406503a937ef550ab0bbd0f6e0188b9e93e206beb1dfc79bb81",)),
+                    $mod.downloadFile("75899c5ace600406503a937ef550ab0bbd0f6e0188b9e93e206beb1dfc79bb81"),
+                    $mod.getFileChildren("75899c5ace600406503a937ef550ab0bbd0f6e0188b9e93e206beb1dfc79bb81"),
+                    $mod.getSubmissionFileTree("bar"),
+                ))
+                """
+            self.eq((None, {}, None, None, None), await core.callStorm(q))
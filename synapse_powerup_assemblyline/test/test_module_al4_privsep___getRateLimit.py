@@ -0,0 +1,75 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test__getRateLimit(self):
+        """
+        Validate the limit of the endpoint class is used, or the default limit when it has none
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupAdminMod = $lib.import(al4.setup.admin)
+                $setupAdminMod.setGlobalAPIHost("https://al4.local")
+                $setupAdminMod.setGlobalRateLimit("https://al4.local", "search", 600, burst=10)
+                $setupAdminMod.setGlobalRateLimit("https://al4.local", "default", 60)
+                $setupAdminMod.setGlobalRateLimit("https://al2.local", "ontology", 30)
+
+                $mod = $lib.import(al4.privsep)
+                return((
+                    $mod._getRateLimit("search"),
+                    $mod._getRateLimit("ontology"),
+                    $lib.guid("https://al4.local"),
+                ))
+                """
+            search, ontology, hostguid = await core.callStorm(q)
+
+            self.eq(("power-ups", "al4", "ratelimit", hostguid, "search"), search.get("path"))
+            self.eq(600, search.get("rate"))
+            self.eq(10, search.get("burst"))
+
+            self.eq(("power-ups", "al4", "ratelimit", hostguid, "default"), ontology.get("path"))
+            self.eq(60, ontology.get("rate"))
+            self.eq(1, ontology.get("burst"))
+
+    async def test__getRateLimit_notConfigured(self):
+        """
+        Validate the endpoint class has its own bucket and no rate when no limit is configured
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupAdminMod = $lib.import(al4.setup.admin)
+                $setupAdminMod.setGlobalAPIHost("https://al4.local")
+
+                $mod = $lib.import(al4.privsep)
+                return(($mod._getRateLimit("search"), $lib.guid("https://al4.local")))
+                """
+            limit, hostguid = await core.callStorm(q)
+
+            self.eq(("power-ups", "al4", "ratelimit", hostguid, "search"), limit.get("path"))
+            self.none(limit.get("rate"))
+            self.none(limit.get("burst"))
+
+    async def test__getRateLimit_Raises_NeedConfValu_for_no_api_host(self):
+        """
+        Verify Raises NeedConfValu when api host is not set
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                return($mod._getRateLimit("search"))
+                """
+            with self.raises(s_exc.NeedConfValu) as exc:
+                await core.callStorm(q)
+            self.isin(
+                "NeedConfValu Exception - The Assemblyline API host is not configured. Run al4.setup.apihost",
+                exc.exception.get("mesg"),
+            )
@@ -0,0 +1,45 @@
+import logging
+import time
+
+from email.utils import formatdate
+
+import pytest
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test__getRetryAfter(self):
+        """
+        Validate the Retry-After header is honored as seconds or as an HTTP date, within the max wait
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                return($mod._getRetryAfter(({"code": 429, "headers": $headers}), 1))
+                """
+            for valu, expected in (("5", 5), ("0", 1), ("1000", 300)):
+                opts = {"vars": {"headers": {"Retry-After": valu}}}
+                self.eq(expected, await core.callStorm(q, opts=opts))
+
+            opts = {"vars": {"headers": {"retry-after": formatdate(time.time() + 60, usegmt=True)}}}
+            seconds = await core.callStorm(q, opts=opts)
+            self.ge(seconds, 55)
+            self.le(seconds, 60)
+
+    async def test__getRetryAfter_backoff(self):
+        """
+        Validate the wait doubles with every attempt when there is no valid Retry-After header
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                return($mod._getRetryAfter(({"code": 503, "headers": $headers}), $attempt))
+                """
+            for headers in ({}, {"Retry-After": "foo"}, None):
+                for attempt, expected in ((1, 1), (2, 2), (3, 4)):
+                    opts = {"vars": {"headers": headers, "attempt": attempt}}
+                    self.eq(expected, await core.callStorm(q, opts=opts))
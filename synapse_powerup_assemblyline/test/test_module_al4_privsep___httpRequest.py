@@ -0,0 +1,105 @@
+import hashlib
+import logging
+
+import pytest
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+
+    """
+    NOTE: The Assemblyline API responses are replayed from the testassets cassettes of each test
+    """
+
+    async def test__httpRequest(self):
+        """
+        Validate throttled and unavailable responses are retried after the Retry-After wait
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $lib.import(al4.setup.admin).setGlobalAPIHost("https://al4.local")
+
+                $mod = $lib.import(al4.privsep)
+
+                $start = $lib.time.now()
+                $resp = $mod._httpRequest("search", "POST", "https://al4.local/api/v4/search/file/", json=({"query": "*"}))
+
+                $elapsed = ($lib.time.now() - $start)
+
+                // without a rate limit only this caller waits, so the bucket is not paused
+                $bucket = $lib.jsonstor.get(("power-ups", "al4", "ratelimit", $lib.guid("https://al4.local"), "search"))
+
+                return(($resp.code, $lib.json.load($resp.body), $elapsed, $bucket))
+                """
+            code, body, elapsed, bucket = await core.callStorm(q)
+
+            self.eq(200, code)
+            self.eq({"api_response": "ok"}, body)
+
+            # 1 second of Retry-After, then 2 seconds of backoff for the second retry
+            self.ge(elapsed, 3000)
+            self.none(bucket)
+
+    async def test__httpRequest_wget(self):
+        """
+        Validate the response body is saved to the axon once the request is no longer throttled
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $lib.import(al4.setup.admin).setGlobalAPIHost("https://al4.local")
+
+                $mod = $lib.import(al4.privsep)
+                $url = "https://al4.local/api/v4/file/download/foo/"
+
+                $resp = $mod._httpRequest("download", "GET", $url, params=({"encoding": "raw"}), wget=$lib.true)
+
+                return(($resp.code, $lib.bytes.has($resp.hashes.sha256), $lib.bytes.has($throttled)))
+                """
+            opts = {"vars": {"throttled": hashlib.sha256(b"throttled").hexdigest()}}
+            code, has, hasThrottled = await core.callStorm(q, opts=opts)
+
+            self.eq(200, code)
+            self.true(has)
+
+            # the body of the throttled response is not kept
+            self.false(hasThrottled)
+
+    async def test__httpRequest_wget_error(self):
+        """
+        Validate the body of an error response is not kept in the axon
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $lib.import(al4.setup.admin).setGlobalAPIHost("https://al4.local")
+
+                $mod = $lib.import(al4.privsep)
+                $url = "https://al4.local/api/v4/ontology/file/foo/"
+
+                $resp = $mod._httpRequest("ontology", "GET", $url, wget=$lib.true)
+
+                return(($resp.code, $lib.bytes.has($resp.hashes.sha256)))
+                """
+            code, has = await core.callStorm(q)
+
+            self.eq(404, code)
+            self.false(has)
+
+    async def test__httpRequest_maxRetries(self):
+        """
+        Validate the last throttled response is returned once the retries are exhausted
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $lib.import(al4.setup.admin).setGlobalAPIHost("https://al4.local")
+
+                $mod = $lib.import(al4.privsep)
+                return($mod._httpRequest("submit", "POST", "https://al4.local/api/v4/submit/").code)
+                """
+            code = await core.callStorm(q)
+
+            # a fifth request would not be found in the cassette
+            self.eq(429, code)
@@ -0,0 +1,71 @@
+import asyncio
+import logging
+
+import pytest
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test__joinInFlight_leader(self):
+        """
+        Validate the first caller leads the fetch and holds its in-flight queue
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $leader = $mod._joinInFlight("file.ontology", "foo")
+                return(($leader, $lib.queue.get("power-ups.al4.inflight.file.ontology.foo").name))
+                """
+            leader, name = await core.callStorm(q)
+
+            self.true(leader)
+            self.eq(name, "power-ups.al4.inflight.file.ontology.foo")
+
+    async def test__joinInFlight_waitsOnLeader(self):
+        """
+        Validate a caller waits on the leader until it releases the fetch and does not take it over
+        """
+        async with self.getTestCoreWithPkg() as core:
+            leaderq = """
+                $mod = $lib.import(al4.privsep)
+                $leader = $mod._joinInFlight("file.ontology", "foo")
+                $lib.time.sleep(2)
+                $mod._releaseInFlight("file.ontology", "foo")
+                return($leader)
+                """
+            waiterq = """
+                $mod = $lib.import(al4.privsep)
+                $lib.time.sleep(0.5)
+
+                $start = $lib.time.now()
+                $leader = $mod._joinInFlight("file.ontology", "foo")
+
+                return(($leader, ($lib.time.now() - $start)))
+                """
+            leader, (waiter, elapsed) = await asyncio.gather(core.callStorm(leaderq), core.callStorm(waiterq))
+
+            self.true(leader)
+            self.false(waiter)
+            self.ge(elapsed, 1000)
+
+    async def test__joinInFlight_singleLeader(self):
+        """
+        Validate a single caller leads the fetch when many join it at the same time
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $leader = $mod._joinInFlight("file.ontology", "foo")
+                if $leader {
+                    $lib.time.sleep(1)
+                    $mod._releaseInFlight("file.ontology", "foo")
+                }
+                return($leader)
+                """
+            leaders = await asyncio.gather(*[core.callStorm(q) for _ in range(5)])
+
+            self.len(1, [leader for leader in leaders if leader])
@@ -0,0 +1,65 @@
+import logging
+
+import pytest
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test__recordCacheAccess(self):
+        """
+        Validate the requests of a query are saved as one entry with its time once the cache stats are flushed
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod._recordCacheAccess("file.ontology", ("foo", "bar"))
+                $mod._recordCacheAccess("file.ontology", ("foo",))
+                $mod._recordCacheAccess("file.ontology", ())
+
+                $pending = $lib.list()
+                for ($path, $access) in $lib.jsonstor.iter(path=("power-ups", "al4", "access", "file.ontology")) {
+                    $pending.append($access)
+                }
+
+                $mod.flushCacheStats()
+
+                $entries = $lib.list()
+                for ($path, $access) in $lib.jsonstor.iter(path=("power-ups", "al4", "access", "file.ontology")) {
+                    $entries.append($access)
+                }
+                return(($pending, $entries))
+                """
+            pending, entries = await core.callStorm(q)
+
+            self.eq([], pending)
+            self.len(1, entries)
+            self.eq(["bar", "foo", "foo"], sorted(entries[0].get("keys")))
+            self.nn(entries[0].get("time"))
+
+    async def test__recordCacheAccess_getFilesOntologyResults(self):
+        """
+        Validate the requests of getFilesOntologyResults are saved unless recordAccess is false
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $lib.jsonstor.cacheset(("power-ups", "al4", "cache", "file", "ontology"), "foo", "{}")
+                $lib.jsonstor.cacheset(("power-ups", "al4", "cache", "file", "ontology"), "bar", "{}")
+
+                $mod = $lib.import(al4.privsep)
+                $mod.getFilesOntologyResults(("foo", "bar"))
+                $mod.getFilesOntologyResults(("foo",), recordAccess=$lib.false)
+                $mod.flushCacheStats()
+
+                $entries = $lib.list()
+                for ($path, $access) in $lib.jsonstor.iter(path=("power-ups", "al4", "access", "file.ontology")) {
+                    $entries.append($access.keys)
+                }
+                return($entries)
+                """
+            entries = await core.callStorm(q)
+
+            self.eq([("foo", "bar")], entries)
@@ -0,0 +1,49 @@
+import logging
+
+import pytest
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test__releaseInFlight(self):
+        """
+        Validate the in-flight queue is deleted so the next caller leads without waiting
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod._joinInFlight("submission.tree", "bar")
+                $mod._releaseInFlight("submission.tree", "bar")
+
+                $released = $lib.false
+                try {
+                    $lib.queue.get("power-ups.al4.inflight.submission.tree.bar")
+                }
+                catch NoSuchName as err {
+                    $released = $lib.true
+                }
+
+                return(($released, $mod._joinInFlight("submission.tree", "bar")))
+                """
+            released, leader = await core.callStorm(q)
+
+            self.true(released)
+            self.true(leader)
+
+    async def test__releaseInFlight_alreadyReleased(self):
+        """
+        Validate releasing a fetch twice does not raise
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod._joinInFlight("submission.tree", "bar")
+                $mod._releaseInFlight("submission.tree", "bar")
+                $mod._releaseInFlight("submission.tree", "bar")
+                """
+            msgs = await core.stormlist(q)
+            self.stormHasNoErr(msgs)
@@ -0,0 +1,23 @@
+import logging
+
+import pytest
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test__setNegativeCache(self):
+        """
+        Validate the response code is cached per endpoint and key
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod._setNegativeCache("submission.tree", "bar", $lib.cast(int, 403))
+
+                return($lib.jsonstor.cacheget(("power-ups", "al4", "cache", "negative", "submission.tree"), "bar", asof="-1hour"))
+                """
+            self.eq({"code": 403}, await core.callStorm(q))
@@ -0,0 +1,33 @@
+import logging
+
+import pytest
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test__setRetryAfter(self):
+        """
+        Validate the bucket of the endpoint class is paused for the given number of seconds
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupAdminMod = $lib.import(al4.setup.admin)
+                $setupAdminMod.setGlobalAPIHost("https://al4.local")
+
+                $mod = $lib.import(al4.privsep)
+
+                $now = $lib.time.now()
+                $mod._setRetryAfter("search", 30)
+
+                $bucket = $lib.jsonstor.get(("power-ups", "al4", "ratelimit", $lib.guid("https://al4.local"), "search"))
+
+                return(($bucket.until - $now))
+                """
+            pause = await core.callStorm(q)
+
+            self.ge(pause, 30000)
+            self.lt(pause, 31000)
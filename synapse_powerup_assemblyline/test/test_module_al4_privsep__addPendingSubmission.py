@@ -0,0 +1,43 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test_addPendingSubmission(self):
+        """
+        Validate the submission is queued with its options
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod.addPendingSubmission("44A8cH7F03NSF6qqOWOktq", download=$lib.true)
+                return($lib.jsonstor.get(("power-ups", "al4", "pending", "submission", "44A8cH7F03NSF6qqOWOktq")))
+                """
+            valu = await core.callStorm(q)
+            self.eq(valu.get("sid"), "44A8cH7F03NSF6qqOWOktq")
+            self.true(valu.get("download"))
+            self.gt(valu.get("submitted"), 0)
+            self.eq("root", valu.get("user"))
+
+    async def test_addPendingSubmission_missingSid(self):
+        """
+        Validate BadArg is raised when the sid is not specified
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod.addPendingSubmission($lib.null)
+                """
+            with self.raises(s_exc.BadArg) as exc:
+                await core.callStorm(q)
+            self.isin("missing param: sid", exc.exception.get("mesg"))
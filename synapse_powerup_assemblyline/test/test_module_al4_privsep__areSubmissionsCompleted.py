@@ -0,0 +1,99 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    """
+    NOTE: This has limited tests as the Assemblyline API is not being mocked
+
+    TODO: Future, mock AL4 api so the full method can be tested
+        e.g. cannot test the completion status of a submission
+    """
+
+    async def test_areSubmissionsCompleted_missingSids(self):
+        """
+        Validate BadArg is raised when no sids are specified
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                return($mod.areSubmissionsCompleted($lib.list()))
+                """
+            with self.raises(s_exc.BadArg) as exc:
+                await core.callStorm(q)
+            self.isin("missing param: sids", exc.exception.get("mesg"))
+
+    async def test_areSubmissionsCompleted_noAPIHost(self):
+        """
+        Validate it gets to the point of trying to get the API host and fails
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                return($mod.areSubmissionsCompleted(("sid1", "sid2")))
+                """
+            with self.raises(s_exc.NeedConfValu) as exc:
+                await core.callStorm(q)
+            self.isin(
+                "NeedConfValu Exception - The Assemblyline API host is not configured. Run al4.setup.apihost",
+                exc.exception.get("mesg"),
+            )
+
+    async def test_areSubmissionsCompleted_searchFailure(self):
+        """
+        Validate $lib.null is returned when the submission index cannot be searched
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupMod = $lib.import(al4.setup.admin)
+                $setupMod.setGlobalAPIHost("al4.local")
+                $setupMod.setGlobalAPICreds("user", "key")
+
+                $mod = $lib.import(al4.privsep)
+                return($mod.areSubmissionsCompleted(("sid1", "sid2")))
+                """
+            msgs = await core.stormlist(q)
+            self.stormIsInWarn("searchIndex exception occurred", msgs)
+            self.none(await core.callStorm(q))
+
+    async def test_areSubmissionsCompleted_chunks(self):
+        """
+        Validate the sids are searched in chunks and the results of every chunk are merged
+
+        The Assemblyline API responses are replayed from the testassets cassette of this test
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupMod = $lib.import(al4.setup.admin)
+                $setupMod.setGlobalAPIHost("https://al4.local")
+                $setupMod.setGlobalAPICreds("user", "key")
+
+                $sids = $lib.list()
+                for $i in $lib.range(150) {
+                    $sids.append($lib.str.format("sid{i}", i=$i))
+                }
+
+                $mod = $lib.import(al4.privsep)
+                return($mod.areSubmissionsCompleted($sids))
+                """
+            valu = await core.callStorm(q)
+
+            self.len(150, valu)
+            self.true(valu.get("sid0"))
+            self.false(valu.get("sid1"))
+            self.true(valu.get("sid98"))
+            self.false(valu.get("sid99"))
+
+            # only found in the response of the second search
+            self.true(valu.get("sid100"))
+            self.true(valu.get("sid149"))
@@ -0,0 +1,47 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test_delPendingSubmission(self):
+        """
+        Validate only the specified submission is removed from the queue
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod.addPendingSubmission("sid1")
+                $mod.addPendingSubmission("sid2")
+                $mod.delPendingSubmission("sid1")
+
+                $sids = $lib.list()
+                for $item in $mod.getPendingSubmissions() {
+                    $sids.append($item.sid)
+                }
+                return($sids)
+                """
+            valu = await core.callStorm(q)
+            self.eq(valu, ["sid2"])
+
+    async def test_delPendingSubmission_missingSid(self):
+        """
+        Validate BadArg is raised when the sid is not specified
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod.delPendingSubmission($lib.null)
+                """
+            with self.raises(s_exc.BadArg) as exc:
+                await core.callStorm(q)
+            self.isin("missing param: sid", exc.exception.get("mesg"))
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 import pytest
@@ -106,3 +107,65 @@ class Module_privsep_Tests(t_utils.TestUtils):
                 },
                 valu,
             )
+
+    async def test_downloadFile_coalesce(self):
+        """
+        Validate concurrent callers make a single download and reuse its negative cache
+
+        The Assemblyline API response is replayed from the testassets cassette of this test, which only has one
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupMod = $lib.import(al4.setup.admin)
+                $setupMod.setGlobalAPIHost("https://al4.local")
+                $setupMod.setGlobalAPICreds("user", "key")
+                """
+            await core.callStorm(q)
+
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod.downloadFile($sha256)
+                """
+            opts = {"vars": {"sha256": "dcdc6ec773103d01ec77cc18e4014a907a3c118743191cad71aad3c659e29ba7"}}
+            results = await asyncio.gather(core.stormlist(q, opts=opts), core.stormlist(q, opts=opts))
+            for msgs in results:
+                self.stormHasNoErr(msgs)
+
+            warnings = [m[1].get("mesg") for msgs in results for m in msgs if m[0] == "warn"]
+            self.len(1, [w for w in warnings if "file not found for" in w])
+            self.len(0, [w for w in warnings if "exception occurred" in w])
+
+            # the in-flight queue is released
+            q = """
+                return($lib.queue.list())
+                """
+            self.len(0, await core.callStorm(q))
+
+    async def test_downloadFile_noCoalesce(self):
+        """
+        Validate an in-flight fetch is not waited on when the caller opts out
+
+        The Assemblyline API response is replayed from the testassets cassette of this test
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupMod = $lib.import(al4.setup.admin)
+                $setupMod.setGlobalAPIHost("https://al4.local")
+                $setupMod.setGlobalAPICreds("user", "key")
+
+                // the fetch of another caller which would otherwise be waited on
+                $mod = $lib.import(al4.privsep)
+                $mod._joinInFlight("file.download", $sha256)
+
+                $retn = $mod.downloadFile($sha256, coalesce=$lib.false)
+
+                $name = $lib.str.format("power-ups.al4.inflight.file.download.{sha256}", sha256=$sha256)
+                return(($retn, $lib.queue.get($name).name))
+                """
+            opts = {"vars": {"sha256": "dcdc6ec773103d01ec77cc18e4014a907a3c118743191cad71aad3c659e29ba7"}}
+            retn, marker = await core.callStorm(q, opts=opts)
+
+            self.none(retn)
+
+            # the fetch of the other caller is left in flight
+            self.nn(marker)
@@ -0,0 +1,96 @@
+import logging
+
+import pytest
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test_getCacheInfo(self):
+        """
+        Validate the entries, bytes, counters, and ages are reported per cache path
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+
+                $ontpath = ("power-ups", "al4", "cache", "file", "ontology")
+                $lib.jsonstor.cacheset($ontpath, "sha256-1", ({"sha256": "sha256-1", "size": 100}))
+                $lib.jsonstor.cacheset($ontpath, "sha256-2", ({"sha256": "sha256-2", "size": 50}))
+                // results cached before they were stored in the axon are a single string
+                $lib.jsonstor.cacheset($ontpath, "sha256-4", "{}")
+
+                for ($path, $entry) in $lib.jsonstor.iter(path=$ontpath) {
+                    if ($entry.key = "sha256-2") {
+                        $entrypath = $lib.list()
+                        $entrypath.extend($ontpath)
+                        $entrypath.extend($path)
+                    }
+                }
+                $lib.jsonstor.set($entrypath, $lib.cast(time, "-10days"), prop=asof)
+
+                $mod._getCache($ontpath, "sha256-1")
+                $mod._getCache($ontpath, "sha256-3")
+
+                $lib.jsonstor.cacheset(("power-ups", "al4", "cache", "submission", "tree"), "sid-1", ({"foo": "bar"}))
+                $lib.jsonstor.cacheset(("power-ups", "al4", "cache", "ingest"), "key-1", ("iden-1", "iden-2"))
+
+                return($mod.getCacheInfo())
+                """
+            info = await core.callStorm(q)
+
+            ont = info.get("power-ups/al4/cache/file/ontology")
+            self.eq(3, ont.get("entries"))
+            self.gt(ont.get("bytes"), 0)
+            self.eq(150, ont.get("axonBytes"))
+            self.eq(1, ont.get("hits"))
+            self.eq(1, ont.get("misses"))
+            self.lt(ont.get("oldest"), ont.get("newest"))
+            self.eq({"day": 2, "week": 0, "month": 1, "older": 0}, ont.get("ages"))
+
+            tree = info.get("power-ups/al4/cache/submission/tree")
+            self.eq(1, tree.get("entries"))
+            self.eq(0, tree.get("axonBytes"))
+            self.none(tree.get("hits"))
+            self.eq({"day": 1, "week": 0, "month": 0, "older": 0}, tree.get("ages"))
+
+            ingest = info.get("power-ups/al4/cache/ingest")
+            self.eq(1, ingest.get("entries"))
+            self.eq(0, ingest.get("axonBytes"))
+
+    async def test_getCacheInfo_path(self):
+        """
+        Validate only the caches under the path are reported
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+
+                $mod._getCache(("power-ups", "al4", "cache", "submission", "ontology"), "sid-1")
+                $lib.jsonstor.cacheset(("power-ups", "al4", "cache", "submission", "tree"), "sid-1", ({"foo": "bar"}))
+                $lib.jsonstor.cacheset(("power-ups", "al4", "cache", "file", "ontology"), "sha256-1", ({"sha256": "sha256-1", "size": 100}))
+
+                return($mod.getCacheInfo(path="submission"))
+                """
+            info = await core.callStorm(q)
+
+            self.sorteq(
+                ["power-ups/al4/cache/submission/ontology", "power-ups/al4/cache/submission/tree"],
+                list(info.keys()),
+            )
+            self.eq(0, info["power-ups/al4/cache/submission/ontology"].get("entries"))
+            self.eq(1, info["power-ups/al4/cache/submission/ontology"].get("misses"))
+
+    async def test_getCacheInfo_empty(self):
+        """
+        Validate an empty dict is returned when nothing is cached
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                return($mod.getCacheInfo())
+                """
+            self.eq({}, await core.callStorm(q))
@@ -0,0 +1,77 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test_getCacheStats_empty(self):
+        """
+        Validate an empty dict is returned when no cache has been used
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                return($mod.getCacheStats())
+                """
+            valu = await core.callStorm(q)
+            self.eq(valu, {})
+
+    async def test_getCacheStats_hitsAndMisses(self):
+        """
+        Validate cache hits and misses are counted per cache path
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+
+                $cachepath = ("power-ups", "al4", "cache", "file", "ontology")
+                $lib.jsonstor.cacheset($cachepath, "hit", "ontresult1")
+
+                $mod._getCache($cachepath, "hit")
+                $mod._getCache($cachepath, "hit")
+                $mod._getCache($cachepath, "miss")
+
+                return($mod.getCacheStats())
+                """
+            valu = await core.callStorm(q)
+            self.eq(
+                valu,
+                {"power-ups/al4/cache/file/ontology": {"hits": 2, "misses": 1}},
+            )
+
+    async def test_getCacheStats_savedOnFlush(self):
+        """
+        Validate cache lookups are counted in memory and saved once by flushCacheStats()
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+
+                $cachepath = ("power-ups", "al4", "cache", "file", "ontology")
+                $lib.jsonstor.cacheset($cachepath, "hit", "ontresult1")
+
+                $mod._getCache($cachepath, "hit")
+                $mod._getCache($cachepath, "miss")
+                $beforeFlush = $lib.jsonstor.get(("power-ups", "al4", "stats", "cache"))
+
+                $mod.flushCacheStats()
+                $mod._getCache($cachepath, "hit")
+                $mod.flushCacheStats()
+
+                return(($beforeFlush, $lib.jsonstor.get(("power-ups", "al4", "stats", "cache"))))
+                """
+            beforeFlush, afterFlush = await core.callStorm(q)
+            self.none(beforeFlush)
+            self.eq(
+                afterFlush,
+                {"power-ups/al4/cache/file/ontology": {"hits": 2, "misses": 1}},
+            )
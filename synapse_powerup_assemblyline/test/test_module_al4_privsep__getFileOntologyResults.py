@@ -107,3 +107,90 @@ class Module_privsep_Tests(t_utils.TestUtils):
             valu = await core.callStorm(q, opts=opts)
             self.nn(valu)
             self.eq(valu, opts.get("vars").get("api_result"))
+
+    async def test_getFileOntologyResults_cachedString_lines(self):
+        """
+        Validate raw results cached as a single string are split into lines when lines is set
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """ 
+                $mod = $lib.import(al4.privsep)
+                
+                $sha256 = f0e4c2f76c58916ec258f246851bea091d14d4247a2fc3e18694461b1816e13b
+                $cachepath = ("power-ups",
+                    "al4",
+                    "cache",
+                    "file",
+                    "ontology")
+                $lib.jsonstor.cacheset($cachepath, $sha256, $api_result)
+
+                return($mod.getFileOntologyResults($sha256, lines=$lib.true))
+                """
+
+            opts = {
+                "vars": {
+                    "api_result": "ontresult1\nontresult2",
+                }
+            }
+            valu = await core.callStorm(q, opts=opts)
+            self.eq(valu, ["ontresult1", "ontresult2"])
+
+    async def test_getFileOntologyResults_resultsInAxonCache(self):
+        """
+        Validate raw results are streamed from the axon when the cache points to them
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """ 
+                $mod = $lib.import(al4.privsep)
+                
+                $sha256 = f0e4c2f76c58916ec258f246851bea091d14d4247a2fc3e18694461b1816e13b
+                $cachepath = ("power-ups",
+                    "al4",
+                    "cache",
+                    "file",
+                    "ontology")
+
+                ($size, $blob) = $lib.bytes.put($api_result.encode())
+                $lib.jsonstor.cacheset($cachepath, $sha256, ({"sha256": $blob, "size": $size}))
+
+                $lines = $lib.list()
+                for $line in $mod.getFileOntologyResults($sha256) {
+                    $lines.append($line)
+                }
+                return($lines)
+                """
+
+            opts = {
+                "vars": {
+                    "api_result": "ontresult1\nontresult2\n",
+                }
+            }
+            valu = await core.callStorm(q, opts=opts)
+            self.eq(valu, ["ontresult1", "ontresult2"])
+
+    async def test_getFileOntologyResults_resultsNotInAxon(self):
+        """
+        Validate the cache is ignored when the results are no longer in the axon
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """ 
+                $mod = $lib.import(al4.privsep)
+                
+                $sha256 = f0e4c2f76c58916ec258f246851bea091d14d4247a2fc3e18694461b1816e13b
+                $cachepath = ("power-ups",
+                    "al4",
+                    "cache",
+                    "file",
+                    "ontology")
+
+                $blob = 0000000000000000000000000000000000000000000000000000000000000000
+                $lib.jsonstor.cacheset($cachepath, $sha256, ({"sha256": $blob, "size": 10}))
+
+                return($mod.getFileOntologyResults($sha256))
+                """
+            with self.raises(s_exc.NeedConfValu) as exc:
+                await core.callStorm(q)
+            self.isin(
+                "NeedConfValu Exception - The Assemblyline API host is not configured. Run al4.setup.apihost",
+                exc.exception.get("mesg"),
+            )
@@ -0,0 +1,92 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+import synapse.lib.node as s_node
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+
+    """
+    NOTE: This has limited tests as the Assemblyline API is not being mocked
+
+    TODO: Future, mock AL4 api so the full method can be tested
+    """
+
+    async def test_getFilesOntologyResults_Raises_BadArg(self):
+        """
+        Test that BadArg is raised when missing input param
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                return($mod.getFilesOntologyResults($lib.list()))
+                """
+            with self.raises(s_exc.BadArg) as exc:
+                await core.callStorm(q)
+            self.isin(
+                "BadArg Exception - missing param: sha256s",
+                exc.exception.get("mesg"),
+            )
+
+    async def test_getFilesOntologyResults_Raises_NeedConfValu_for_no_api_host(self):
+        """
+        Verify Raises NeedConfValu when api host is not set and files are not cached
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """ 
+                $mod = $lib.import(al4.privsep)
+                $inp = (
+                    'dcdc6ec773103d01ec77cc18e4014a907a3c118743191cad71aad3c659e29ba7',
+                    'f0e4c2f76c58916ec258f246851bea091d14d4247a2fc3e18694461b1816e13b',
+                )
+                return($mod.getFilesOntologyResults($inp))
+                """
+            with self.raises(s_exc.NeedConfValu) as exc:
+                await core.callStorm(q)
+            self.isin(
+                "NeedConfValu Exception - The Assemblyline API host is not configured. Run al4.setup.apihost",
+                exc.exception.get("mesg"),
+            )
+
+    async def test_getFilesOntologyResults_resultsInCache(self):
+        """
+        Validate raw results are returned per file without calling the API when all files are cached
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """ 
+                $mod = $lib.import(al4.privsep)
+                
+                $cachepath = ("power-ups",
+                    "al4",
+                    "cache",
+                    "file",
+                    "ontology")
+                $lib.jsonstor.cacheset($cachepath, $sha256_1, "ontresult1")
+                $lib.jsonstor.cacheset($cachepath, $sha256_2, "ontresult2")
+
+                return($mod.getFilesOntologyResults(($sha256_1, $sha256_2)))
+                """
+
+            opts = {
+                "vars": {
+                    "sha256_1": "f0e4c2f76c58916ec258f246851bea091d14d4247a2fc3e18694461b1816e13b",
+                    "sha256_2": "dcdc6ec773103d01ec77cc18e4014a907a3c118743191cad71aad3c659e29ba7",
+                }
+            }
+            valu = await core.callStorm(q, opts=opts)
+            self.eq(
+                valu,
+                {
+                    "f0e4c2f76c58916ec258f246851bea091d14d4247a2fc3e18694461b1816e13b": "ontresult1",
+                    "dcdc6ec773103d01ec77cc18e4014a907a3c118743191cad71aad3c659e29ba7": "ontresult2",
+                },
+            )
@@ -0,0 +1,40 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test_getIngestState(self):
+        """
+        Validate the recorded node idens are returned within the asof timeframe
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod.setIngestState("key1", ("iden1", "iden2"))
+                return(($mod.getIngestState("key1"), $mod.getIngestState("key2")))
+                """
+            valu = await core.callStorm(q)
+            self.eq(valu, (["iden1", "iden2"], None))
+
+    async def test_getIngestState_missingKey(self):
+        """
+        Validate BadArg is raised when the key is not specified
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                return($mod.getIngestState($lib.null))
+                """
+            with self.raises(s_exc.BadArg) as exc:
+                await core.callStorm(q)
+            self.isin("missing param: key", exc.exception.get("mesg"))
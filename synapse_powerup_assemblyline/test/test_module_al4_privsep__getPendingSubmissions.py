@@ -0,0 +1,43 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test_getPendingSubmissions_empty(self):
+        """
+        Validate an empty list is returned when no submissions are queued
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                return($mod.getPendingSubmissions())
+                """
+            valu = await core.callStorm(q)
+            self.eq(valu, [])
+
+    async def test_getPendingSubmissions(self):
+        """
+        Validate all queued submissions are returned
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod.addPendingSubmission("sid1")
+                $mod.addPendingSubmission("sid2", download=$lib.true)
+                return($mod.getPendingSubmissions())
+                """
+            valu = await core.callStorm(q)
+            self.eq(
+                sorted((item.get("sid"), item.get("download")) for item in valu),
+                [("sid1", False), ("sid2", True)],
+            )
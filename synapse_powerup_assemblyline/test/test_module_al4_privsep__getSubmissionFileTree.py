@@ -107,3 +107,59 @@ class Module_privsep_Tests(t_utils.TestUtils):
             valu = await core.callStorm(q, opts=opts)
             self.nn(valu)
             self.eq(valu, opts.get("vars").get("api_result"))
+
+    async def test_getSubmissionFileTree_cacheHitsAreCounted(self):
+        """
+        Validate every cache hit for the submission tree is counted
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """ 
+                $mod = $lib.import(al4.privsep)
+                
+                $sid = '31AzwEFtMkWSNo2rcMXxyA'
+                $cachepath = ("power-ups",
+                    "al4",
+                    "cache",
+                    "submission",
+                    "tree")
+                $lib.jsonstor.cacheset($cachepath, $sid, $api_result)
+
+                $mod.getSubmissionFileTree($sid)
+                $mod.getSubmissionFileTree($sid)
+
+                return($mod.getCacheStats())
+                """
+
+            opts = {
+                "vars": {
+                    "api_result": {"tree": {}},
+                }
+            }
+            valu = await core.callStorm(q, opts=opts)
+            self.eq(
+                valu.get("power-ups/al4/cache/submission/tree"),
+                {"hits": 2},
+            )
+
+    async def test_getSubmissionFileTree_coalesce_releasesOnError(self):
+        """
+        Validate the in-flight fetch is released when the request fails and the error is raised
+
+        The invalid Assemblyline API response is replayed from the testassets cassette of this test
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupMod = $lib.import(al4.setup.admin)
+                $setupMod.setGlobalAPIHost("https://al4.local")
+                $setupMod.setGlobalAPICreds("user", "key")
+
+                $mod = $lib.import(al4.privsep)
+                return($mod.getSubmissionFileTree("sid1"))
+                """
+            with self.raises(s_exc.BadJsonText):
+                await core.callStorm(q)
+
+            q = """
+                return($lib.queue.list())
+                """
+            self.len(0, await core.callStorm(q))
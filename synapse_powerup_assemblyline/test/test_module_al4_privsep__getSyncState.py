@@ -0,0 +1,46 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test_getSyncState(self):
+        """
+        Validate the saved state of each sync job is returned
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $empty = $mod.getSyncState("submission")
+
+                $mod.setSyncState("submission", ({"watermark": 1683590400000}))
+                $mod.setSyncState("alert", ({"watermark": 1683590500000}))
+
+                return(($empty, $mod.getSyncState("submission"), $mod.getSyncState("alert")))
+                """
+            empty, submission, alert = await core.callStorm(q)
+            self.none(empty)
+            self.eq({"watermark": 1683590400000}, submission)
+            self.eq({"watermark": 1683590500000}, alert)
+
+    async def test_getSyncState_missingName(self):
+        """
+        Validate BadArg is raised when the name is not specified
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                return($mod.getSyncState($lib.null))
+                """
+            with self.raises(s_exc.BadArg) as exc:
+                await core.callStorm(q)
+            self.isin("missing param: name", exc.exception.get("mesg"))
@@ -0,0 +1,98 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+
+    """
+    NOTE: This has limited tests as the Assemblyline API is not being mocked
+
+    TODO: Future, mock AL4 api so the full method can be tested
+    """
+
+    async def _setAccess(self, core, key, hits, last):
+        q = """
+            for $i in $lib.range($hits) {
+                $path = ("power-ups", "al4", "access", "file.ontology", $lib.guid())
+                $lib.jsonstor.set($path, ({"time": $lib.cast(time, $last), "keys": $lib.list($key)}))
+            }
+            """
+        await core.callStorm(q, opts={"vars": {"key": key, "hits": hits, "last": last}})
+
+    async def _setStale(self, core, key, asof):
+        q = """
+            $cachepath = ("power-ups", "al4", "cache", "file", "ontology")
+            $lib.jsonstor.cacheset($cachepath, $key, "{}")
+
+            for ($path, $entry) in $lib.jsonstor.iter(path=$cachepath) {
+                if ($entry.key = $key) {
+                    $entrypath = $lib.list()
+                    $entrypath.extend($cachepath)
+                    $entrypath.extend($path)
+                }
+            }
+            $lib.jsonstor.set($entrypath, $lib.cast(time, $asof), prop=asof)
+            """
+        await core.callStorm(q, opts={"vars": {"key": key, "asof": asof}})
+
+    async def test_refreshFileOntologyResults_skipped(self):
+        """
+        Validate fresh, rarely requested, and unknown files are not refreshed, and cold requests are deleted
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await self._setAccess(core, "fresh", 5, "-1hour")
+            await self._setAccess(core, "rare", 1, "-1hour")
+            await self._setAccess(core, "unknown", 5, "-1hour")
+            await self._setAccess(core, "cold", 5, "-10days")
+
+            # only the requests since the given time are counted
+            await self._setAccess(core, "stale", 5, "-10days")
+            await self._setAccess(core, "stale", 1, "-1hour")
+
+            # the API host is not configured, so any refresh would raise NeedConfValu
+            q = """
+                $lib.jsonstor.cacheset(("power-ups", "al4", "cache", "file", "ontology"), "fresh", "{}")
+
+                $mod = $lib.import(al4.privsep)
+                $mod._setNegativeCache("file.ontology", "unknown", $lib.cast(int, 404))
+
+                $refreshed = $mod.refreshFileOntologyResults()
+
+                $keys = $lib.set()
+                for ($path, $access) in $lib.jsonstor.iter(path=("power-ups", "al4", "access", "file.ontology")) {
+                    $keys.adds($access.keys)
+                }
+
+                return(($refreshed, $keys))
+                """
+            refreshed, keys = await core.callStorm(q)
+
+            self.eq(0, refreshed)
+            self.sorteq(["fresh", "rare", "stale", "unknown"], keys)
+
+    async def test_refreshFileOntologyResults_Raises_NeedConfValu_for_no_api_host(self):
+        """
+        Validate the results of a hot file cached before the given time are fetched again
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await self._setAccess(core, "stale", 5, "-1hour")
+            await self._setStale(core, "stale", "-29days")
+
+            q = """
+                $mod = $lib.import(al4.privsep)
+                return($mod.refreshFileOntologyResults())
+                """
+            with self.raises(s_exc.NeedConfValu) as exc:
+                await core.callStorm(q)
+            self.isin(
+                "NeedConfValu Exception - The Assemblyline API host is not configured. Run al4.setup.apihost",
+                exc.exception.get("mesg"),
+            )
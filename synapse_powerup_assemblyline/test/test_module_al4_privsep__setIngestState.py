@@ -0,0 +1,40 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test_setIngestState(self):
+        """
+        Validate the node idens are cached with the ingest state
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod.setIngestState("key1", ("iden1",))
+                return($lib.jsonstor.cacheget(("power-ups", "al4", "cache", "ingest"), "key1", asof="-1day"))
+                """
+            valu = await core.callStorm(q)
+            self.eq(valu, ["iden1"])
+
+    async def test_setIngestState_missingKey(self):
+        """
+        Validate BadArg is raised when the key is not specified
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod.setIngestState($lib.null, ("iden1",))
+                """
+            with self.raises(s_exc.BadArg) as exc:
+                await core.callStorm(q)
+            self.isin("missing param: key", exc.exception.get("mesg"))
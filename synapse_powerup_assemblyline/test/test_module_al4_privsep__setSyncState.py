@@ -0,0 +1,41 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+
+
+import test.utils as t_utils
+
+from pprint import pprint
+
+log = logging.getLogger(__name__)
+
+
+class Module_privsep_Tests(t_utils.TestUtils):
+    async def test_setSyncState(self):
+        """
+        Validate the whole state is replaced
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod.setSyncState("submission", ({"watermark": 1683590400000, "count": 3}))
+                $mod.setSyncState("submission", ({"watermark": 1683590500000}))
+                return($mod.getSyncState("submission"))
+                """
+            valu = await core.callStorm(q)
+            self.eq({"watermark": 1683590500000}, valu)
+
+    async def test_setSyncState_missingName(self):
+        """
+        Validate BadArg is raised when the name is not specified
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.privsep)
+                $mod.setSyncState($lib.null, ({"watermark": 1683590400000}))
+                """
+            with self.raises(s_exc.BadArg) as exc:
+                await core.callStorm(q)
+            self.isin("missing param: name", exc.exception.get("mesg"))
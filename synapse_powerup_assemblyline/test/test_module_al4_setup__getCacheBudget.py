@@ -0,0 +1,45 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_setup_Tests(t_utils.TestUtils):
+    async def test_getCacheBudget(self):
+        """
+        Validate the cache budget is returned, or null when it is not set
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.setup)
+                return($mod.getCacheBudget())
+                """
+            self.none(await core.callStorm(q))
+
+            q = """
+                $lib.import(al4.setup.admin).setGlobalCacheBudget(1073741824)
+
+                $mod = $lib.import(al4.setup)
+                return($mod.getCacheBudget())
+                """
+            self.eq(1073741824, await core.callStorm(q))
+
+    async def test_getCacheBudget_raises_AuthDeny_noAsRootPerms(self):
+        """
+        Verify Raises AuthDeny for a user that does not have asRoot permissions
+        """
+        async with self.getTestCoreWithPkg() as core:
+            user = await core.auth.addUser("user1")
+            await user.addRule((True, ("power-ups", "al4", "user")))
+
+            async with core.getLocalProxy(user="user1") as asuser1:
+                q = """
+                $mod = $lib.import(al4.setup)
+                return($mod.getCacheBudget())
+                """
+                await self.asyncraises(s_exc.AuthDeny, asuser1.callStorm(q))
@@ -0,0 +1,57 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_setup_Tests(t_utils.TestUtils):
+    async def test_getRateLimits(self):
+        """
+        Validate the rate limits are returned
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $setupAdminMod = $lib.import(al4.setup.admin)
+                $setupAdminMod.setGlobalRateLimit("https://al4.local", "search", 600, burst=10)
+
+                $mod = $lib.import(al4.setup)
+
+                return($mod.getRateLimits())
+                """
+            valu = await core.callStorm(q)
+            self.eq(
+                {"https://al4.local": {"search": {"endpoint": "search", "rate": 600, "burst": 10}}},
+                valu,
+            )
+
+    async def test_getRateLimits_returns_empty(self):
+        """
+        Verify returns an empty dict when no rate limit is set
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.setup)
+                return($mod.getRateLimits())
+                """
+            valu = await core.callStorm(q)
+            self.eq({}, valu)
+
+    async def test_getRateLimits_raises_AuthDeny_noAsRootPerms(self):
+        """
+        Verify Raises AuthDeny for a user that does not have asRoot permissions
+        """
+        async with self.getTestCoreWithPkg() as core:
+            user = await core.auth.addUser("user1")
+            await user.addRule((True, ("power-ups", "al4", "user")))
+
+            async with core.getLocalProxy(user="user1") as asuser1:
+                q = """
+                $mod = $lib.import(al4.setup)
+                return($mod.getRateLimits())
+                """
+                await self.asyncraises(s_exc.AuthDeny, asuser1.callStorm(q))
@@ -0,0 +1,51 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_setup_admin_Tests(t_utils.TestUtils):
+    async def test_getGlobalRateLimits(self):
+        """
+        Validate the rate limits of every API host are returned
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+
+                $empty = $mod.getGlobalRateLimits()
+
+                $mod.setGlobalRateLimit("https://al4.local", "search", 600, burst=10)
+                $mod.setGlobalRateLimit("https://al2.local", "default", 60)
+
+                return(($empty, $mod.getGlobalRateLimits()))
+                """
+            empty, valu = await core.callStorm(q)
+            self.eq({}, empty)
+            self.eq(
+                {
+                    "https://al4.local": {"search": {"endpoint": "search", "rate": 600, "burst": 10}},
+                    "https://al2.local": {"default": {"endpoint": "default", "rate": 60, "burst": 1}},
+                },
+                valu,
+            )
+
+    async def test_getGlobalRateLimits_raises_AuthDeny_noAsRootPerms(self):
+        """
+        Verify AuthDeny for a user that is a member of the power-ups.al4.user group
+        """
+        async with self.getTestCoreWithPkg() as core:
+            user = await core.auth.addUser("user")
+            await user.addRule((True, ("power-ups", "al4", "user")))
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                $mod = $lib.import(al4.setup.admin)
+                return($mod.getGlobalRateLimits())
+                """
+                await self.asyncraises(s_exc.AuthDeny, asuser.callStorm(q))
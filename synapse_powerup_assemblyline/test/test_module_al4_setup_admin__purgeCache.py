@@ -0,0 +1,314 @@
+import hashlib
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_setup_admin_Tests(t_utils.TestUtils):
+    async def _addCacheEntries(self, core):
+        """
+        Add an ontology cache entry per day for the last 5 days, an older submission tree entry, and a negative entry
+
+        The ontology results of each entry are 9 bytes saved in the axon.
+        """
+        q = """
+            $cachepath = ("power-ups", "al4", "cache", "file", "ontology")
+
+            for $days in (0, 1, 2, 3, 4) {
+                $key = $lib.str.format("sha256-{days}", days=$days)
+                ($size, $sha256) = $lib.bytes.put($lib.str.format("results-{days}", days=$days).encode())
+                $lib.jsonstor.cacheset($cachepath, $key, ({"sha256": $sha256, "size": $size}))
+            }
+
+            $treepath = ("power-ups", "al4", "cache", "submission", "tree")
+            $lib.jsonstor.cacheset($treepath, "sid-1", ({"foo": "bar"}))
+
+            $lib.jsonstor.cacheset(("power-ups", "al4", "cache", "negative", "file.ontology"), "sha256-9", ({"code": 404}))
+
+            // the entries are cached a day apart, and the submission tree entry 60 days ago
+            $asofs = $lib.list()
+            for ($path, $entry) in $lib.jsonstor.iter(path=("power-ups", "al4", "cache")) {
+                $entrypath = $lib.list()
+                $entrypath.extend(("power-ups", "al4", "cache"))
+                $entrypath.extend($path)
+
+                if ($entry.key = "sid-1") {
+                    $asofs.append(($entrypath, $lib.cast(time, "-60days")))
+                }
+                elif ($path.0 = "file") {
+                    $days = $entry.key.replace("sha256-", "")
+                    $asofs.append(($entrypath, $lib.cast(time, $lib.str.format("-{days}days", days=$days))))
+                }
+            }
+
+            for ($entrypath, $asof) in $asofs {
+                $lib.jsonstor.set($entrypath, $asof, prop=asof)
+            }
+            """
+        await core.callStorm(q)
+
+    async def _getAxonResults(self, core):
+        """
+        Get the days of the ontology results of the cache entries which are still in the axon
+        """
+        q = """
+            return($lib.bytes.has($sha256))
+            """
+        days = []
+        for day in range(5):
+            sha256 = hashlib.sha256(f"results-{day}".encode()).hexdigest()
+            if await core.callStorm(q, opts={"vars": {"sha256": sha256}}):
+                days.append(day)
+        return days
+
+    async def _getCacheKeys(self, core):
+        q = """
+            $keys = $lib.list()
+            for ($path, $entry) in $lib.jsonstor.iter(path=("power-ups", "al4", "cache")) {
+                $keys.append($entry.key)
+            }
+            return($keys)
+            """
+        return sorted(await core.callStorm(q))
+
+    async def test_purgeCache_olderThan(self):
+        """
+        Validate only the entries cached before olderThan are deleted
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await self._addCacheEntries(core)
+
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                return($mod.purgeCache(olderThan="-36hours"))
+                """
+            purged = await core.callStorm(q)
+
+            self.eq(4, purged.get("entries"))
+            self.gt(purged.get("bytes"), 0)
+            self.eq(["sha256-0", "sha256-1", "sha256-9"], await self._getCacheKeys(core))
+
+    async def test_purgeCache_path(self):
+        """
+        Validate only the entries under the path are deleted when no limits are specified
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await self._addCacheEntries(core)
+
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                return($mod.purgeCache(path="file/ontology"))
+                """
+            purged = await core.callStorm(q)
+
+            self.eq(5, purged.get("entries"))
+            self.eq(["sha256-9", "sid-1"], await self._getCacheKeys(core))
+
+    async def test_purgeCache_key(self):
+        """
+        Validate only the entries of the key are deleted
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await self._addCacheEntries(core)
+
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                return($mod.purgeCache(key="sid-1"))
+                """
+            purged = await core.callStorm(q)
+
+            self.eq(1, purged.get("entries"))
+            self.notin("sid-1", await self._getCacheKeys(core))
+
+    async def test_purgeCache_maxEntries(self):
+        """
+        Validate the least recently used matched entries are evicted until the rest fit within maxEntries
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await self._addCacheEntries(core)
+
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                return($mod.purgeCache(path="file/ontology", maxEntries=$lib.cast(int, 2)))
+                """
+            purged = await core.callStorm(q)
+
+            self.eq(3, purged.get("entries"))
+            self.eq(["sha256-0", "sha256-1", "sha256-9", "sid-1"], await self._getCacheKeys(core))
+
+    async def test_purgeCache_maxBytes(self):
+        """
+        Validate the least recently used entries are evicted until the rest fit within maxBytes
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await self._addCacheEntries(core)
+
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                return($mod.purgeCache(maxBytes=$lib.cast(int, 1)))
+                """
+            purged = await core.callStorm(q)
+
+            self.eq(7, purged.get("entries"))
+            self.eq([], await self._getCacheKeys(core))
+
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                return($mod.purgeCache(maxBytes=$lib.cast(int, 0)))
+                """
+            self.eq({"entries": 0, "bytes": 0, "axonBytes": 0}, await core.callStorm(q))
+
+    async def test_purgeCache_maxBytes_evictsOldest(self):
+        """
+        Validate only the least recently used entries are evicted when the rest fit within maxBytes and maxEntries
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await self._addCacheEntries(core)
+
+            q = """
+                for ($path, $entry) in $lib.jsonstor.iter(path=("power-ups", "al4", "cache", "file", "ontology")) {
+                    if ($entry.key = "sha256-0") {
+                        return($lib.json.save($entry).size())
+                    }
+                }
+                """
+            size = await core.callStorm(q)
+
+            # room for the 3 newest entries
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                return($mod.purgeCache(path="file/ontology", maxBytes=$maxBytes))
+                """
+            purged = await core.callStorm(q, opts={"vars": {"maxBytes": size * 3 + 1}})
+
+            self.eq({"entries": 2, "bytes": size * 2, "axonBytes": 18}, purged)
+            self.eq(["sha256-0", "sha256-1", "sha256-2", "sha256-9", "sid-1"], await self._getCacheKeys(core))
+
+            # the entry budget evicts more than the byte budget
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                return($mod.purgeCache(path="file/ontology", maxEntries=$lib.cast(int, 1), maxBytes=$maxBytes))
+                """
+            purged = await core.callStorm(q, opts={"vars": {"maxBytes": size * 3 + 1}})
+
+            self.eq(2, purged.get("entries"))
+            self.eq(["sha256-0", "sha256-9", "sid-1"], await self._getCacheKeys(core))
+
+    async def test_purgeCache_maxAxonBytes(self):
+        """
+        Validate the least recently used entries are evicted until their ontology results fit within maxAxonBytes
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await self._addCacheEntries(core)
+
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                return($mod.purgeCache(maxAxonBytes=$lib.cast(int, 20)))
+                """
+            purged = await core.callStorm(q)
+
+            # the entries without results in the axon are not evicted for it
+            self.eq({"entries": 3, "axonBytes": 27}, {k: purged.get(k) for k in ("entries", "axonBytes")})
+            self.eq(["sha256-0", "sha256-1", "sha256-9", "sid-1"], await self._getCacheKeys(core))
+
+    async def test_purgeCache_evictsLeastRecentlyUsed(self):
+        """
+        Validate the entries whose results were requested recently are kept over the ones cached more recently
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await self._addCacheEntries(core)
+
+            q = """
+                // the oldest entry was requested an hour ago, and the second oldest three days ago
+                $keys = ("sha256-4",)
+                $lib.jsonstor.set(("power-ups", "al4", "access", "file.ontology", $lib.guid()),
+                    ({"time": $lib.cast(time, "-1hour"), "keys": $keys}))
+
+                $keys = ("sha256-3",)
+                $lib.jsonstor.set(("power-ups", "al4", "access", "file.ontology", $lib.guid()),
+                    ({"time": $lib.cast(time, "-3days"), "keys": $keys}))
+
+                $mod = $lib.import(al4.setup.admin)
+                return($mod.purgeCache(path="file/ontology", maxEntries=$lib.cast(int, 2)))
+                """
+            purged = await core.callStorm(q)
+
+            self.eq(3, purged.get("entries"))
+            self.eq(["sha256-0", "sha256-4", "sha256-9", "sid-1"], await self._getCacheKeys(core))
+
+    async def test_purgeCache_deletesAxonResults(self):
+        """
+        Validate the ontology results of the deleted entries are deleted from the axon, and the others are kept
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await self._addCacheEntries(core)
+
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                return($mod.purgeCache(olderThan="-36hours"))
+                """
+            purged = await core.callStorm(q)
+
+            self.eq(27, purged.get("axonBytes"))
+            self.eq([0, 1], await self._getAxonResults(core))
+
+    async def test_purgeCache_all(self):
+        """
+        Validate every entry is deleted when nothing is specified
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await self._addCacheEntries(core)
+
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                return($mod.purgeCache())
+                """
+            purged = await core.callStorm(q)
+
+            self.eq(7, purged.get("entries"))
+            self.eq([], await self._getCacheKeys(core))
+
+    async def test_purgeCache_Raises_BadArg(self):
+        """
+        Test that BadArg is raised when a budget is negative
+        """
+        async with self.getTestCoreWithPkg() as core:
+            for param in ("maxEntries", "maxBytes", "maxAxonBytes"):
+                q = f"""
+                    $mod = $lib.import(al4.setup.admin)
+                    return($mod.purgeCache({param}=$lib.cast(int, -1)))
+                    """
+                with self.raises(s_exc.BadArg) as exc:
+                    await core.callStorm(q)
+                self.isin(
+                    f"BadArg Exception - {param} param expects an int of 0 or more",
+                    exc.exception.get("mesg"),
+                )
+
+
+class Command_AL4_CACHE_PURGE_Tests(t_utils.TestUtils):
+    async def test_run_command(self):
+        """
+        Verify the number of purged entries is printed, and the help is shown when nothing is specified
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $lib.jsonstor.cacheset(("power-ups", "al4", "cache", "submission", "tree"), "sid-1", ({"foo": "bar"}))
+                $lib.jsonstor.cacheset(("power-ups", "al4", "cache", "submission", "tree"), "sid-2", ({"foo": "bar"}))
+                """
+            await core.callStorm(q)
+
+            msgs = await core.stormlist("al4.cache.purge")
+            self.stormIsInPrint("Usage: al4.cache.purge [options]", msgs)
+
+            msgs = await core.stormlist("al4.cache.purge --key sid-1")
+            self.stormIsInPrint("Purged 1 Assemblyline cache entries", msgs)
+
+            msgs = await core.stormlist("al4.cache.purge --all")
+            self.stormIsInPrint("Purged 1 Assemblyline cache entries", msgs)
@@ -0,0 +1,27 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_setup_admin_Tests(t_utils.TestUtils):
+    async def test_removeGlobalCacheBudget(self):
+        """
+        Validate the cache budget is removed, and no error when it is not there to remove
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                $mod.setGlobalCacheBudget(1073741824)
+
+                $mod.removeGlobalCacheBudget()
+                $mod.removeGlobalCacheBudget()
+
+                return($mod.getGlobalCacheBudget())
+                """
+            self.none(await core.callStorm(q))
@@ -0,0 +1,60 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_setup_admin_Tests(t_utils.TestUtils):
+    async def test_removeGlobalRateLimit(self):
+        """
+        Validate the rate limit of an endpoint class is removed, and the API host once it has no limit left
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                $mod.setGlobalRateLimit("https://al4.local", "search", 600)
+                $mod.setGlobalRateLimit("https://al4.local", "download", 60)
+
+                $mod.removeGlobalRateLimit("https://al4.local", "search")
+                $first = $mod.getGlobalRateLimits()
+
+                $mod.removeGlobalRateLimit("https://al4.local", "download")
+
+                return(($first, $mod.getGlobalRateLimits()))
+                """
+            first, valu = await core.callStorm(q)
+            self.eq({"https://al4.local": {"download": {"endpoint": "download", "rate": 60, "burst": 1}}}, first)
+            self.eq({}, valu)
+
+        """
+        Validate no error when the rate limit is not there to remove
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                $mod.removeGlobalRateLimit("https://al4.local", "search")
+
+                return($mod.getGlobalRateLimits())
+                """
+            valu = await core.callStorm(q)
+            self.eq({}, valu)
+
+    async def test_removeGlobalRateLimit_raises_AuthDeny_noAsRootPerms(self):
+        """
+        Verify AuthDeny for a user that is a member of the power-ups.al4.user group
+        """
+        async with self.getTestCoreWithPkg() as core:
+            user = await core.auth.addUser("user")
+            await user.addRule((True, ("power-ups", "al4", "user")))
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                $mod = $lib.import(al4.setup.admin)
+                $mod.removeGlobalRateLimit("https://al4.local", "search")
+                """
+                await self.asyncraises(s_exc.AuthDeny, asuser.callStorm(q))
@@ -0,0 +1,56 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_setup_admin_Tests(t_utils.TestUtils):
+    async def test_setGlobalCacheBudget(self):
+        """
+        Validate the cache budget is set
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                $mod.setGlobalCacheBudget(1073741824)
+
+                return($mod.getGlobalCacheBudget())
+                """
+            self.eq(1073741824, await core.callStorm(q))
+
+    async def test_setGlobalCacheBudget_raises_BadArg(self):
+        """
+        Validate BadArg is raised when the budget is not an int greater than 0
+        """
+        async with self.getTestCoreWithPkg() as core:
+            for valu in ("0", "foo"):
+                q = """
+                    $mod = $lib.import(al4.setup.admin)
+                    $mod.setGlobalCacheBudget($valu)
+                    """
+                with self.raises(s_exc.BadArg) as exc:
+                    await core.callStorm(q, opts={"vars": {"valu": valu}})
+                self.isin(
+                    "BadArg Exception - maxAxonBytes param expects an int greater than 0",
+                    exc.exception.get("mesg"),
+                )
+
+    async def test_setGlobalCacheBudget_raises_AuthDeny_noAsRootPerms(self):
+        """
+        Verify AuthDeny for a user that is a member of the power-ups.al4.user group
+        """
+        async with self.getTestCoreWithPkg() as core:
+            user = await core.auth.addUser("user")
+            await user.addRule((True, ("power-ups", "al4", "user")))
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                $mod = $lib.import(al4.setup.admin)
+                $mod.setGlobalCacheBudget(1073741824)
+                """
+                await self.asyncraises(s_exc.AuthDeny, asuser.callStorm(q))
@@ -0,0 +1,92 @@
+import logging
+
+import pytest
+
+import synapse.exc as s_exc
+import test.utils as t_utils
+
+
+log = logging.getLogger(__name__)
+
+
+class Module_setup_admin_Tests(t_utils.TestUtils):
+    async def test_setGlobalRateLimit(self):
+        """
+        Validate the rate limit of an endpoint class is set and replaced
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                $mod.setGlobalRateLimit("https://al4.local", "search", 600, burst=10)
+                $mod.setGlobalRateLimit("https://al4.local", "download", 60)
+                $mod.setGlobalRateLimit("https://al4.local", "search", "300")
+
+                return($mod.getGlobalRateLimits())
+                """
+            valu = await core.callStorm(q)
+            self.eq(
+                {
+                    "https://al4.local": {
+                        "search": {"endpoint": "search", "rate": 300, "burst": 1},
+                        "download": {"endpoint": "download", "rate": 60, "burst": 1},
+                    }
+                },
+                valu,
+            )
+
+    async def test_setGlobalRateLimit_Raises_BadArg(self):
+        """
+        Test that BadArg is raised when missing or invalid input param
+        """
+        async with self.getTestCoreWithPkg() as core:
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                $mod.setGlobalRateLimit($lib.null, "search", 600)
+                """
+            with self.raises(s_exc.BadArg) as exc:
+                await core.callStorm(q)
+            self.isin("BadArg Exception - missing param: apiHost", exc.exception.get("mesg"))
+
+            q = """
+                $mod = $lib.import(al4.setup.admin)
+                $mod.setGlobalRateLimit("https://al4.local", "foo", 600)
+                """
+            with self.raises(s_exc.BadArg) as exc:
+                await core.callStorm(q)
+            self.isin(
+                "BadArg Exception - endpoint param expects one of: search, ontology, download, submit, default",
+                exc.exception.get("mesg"),
+            )
+
+            for inp in (None, 0, "foo"):
+                q = """
+                    $mod = $lib.import(al4.setup.admin)
+                    $mod.setGlobalRateLimit("https://al4.local", "search", $inp)
+                    """
+                with self.raises(s_exc.BadArg) as exc:
+                    await core.callStorm(q, opts={"vars": {"inp": inp}})
+                self.isin("BadArg Exception - rate param expects an int greater than 0", exc.exception.get("mesg"))
+
+            for inp in (None, 0, "foo"):
+                q = """
+                    $mod = $lib.import(al4.setup.admin)
+                    $mod.setGlobalRateLimit("https://al4.local", "search", 600, burst=$inp)
+                    """
+                with self.raises(s_exc.BadArg) as exc:
+                    await core.callStorm(q, opts={"vars": {"inp": inp}})
+                self.isin("BadArg Exception - burst param expects an int greater than 0", exc.exception.get("mesg"))
+
+    async def test_setGlobalRateLimit_raises_AuthDeny_noAsRootPerms(self):
+        """
+        Verify AuthDeny for a user that is a member of the power-ups.al4.user group
+        """
+        async with self.getTestCoreWithPkg() as core:
+            user = await core.auth.addUser("user")
+            await user.addRule((True, ("power-ups", "al4", "user")))
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                $mod = $lib.import(al4.setup.admin)
+                $mod.setGlobalRateLimit("https://al4.local", "search", 600)
+                """
+                await self.asyncraises(s_exc.AuthDeny, asuser.callStorm(q))
@@ -11,6 +11,181 @@ import synapse.tests.utils as s_test
 log = logging.getLogger(__name__)
 
 
+class Command_Security_AL4_ALERTS_SYNC_Tests(t_utils.TestUtils):
+    async def test_run_command_with_no_perms_raises_AuthDeny(self):
+        """
+        Run the command and verify Raises AuthDeny for a user that does not have permissions.
+        i.e. user must be a member of power-ups.al4.user
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await core.auth.addUser("user")
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                al4.alerts.sync
+                """
+                await self.asyncraises(s_exc.AuthDeny, asuser.callStorm(q))
+
+    async def test_run_command_with_perms_succeeds(self):
+        """
+        Run the command and verify the --help message works for a user that has perms.
+        i.e. user must be a member of power-ups.al4.user
+        """
+        async with self.getTestCoreWithPkg() as core:
+            user = await core.auth.addUser("user")
+            await user.addRule((True, ("power-ups", "al4", "user")))
+            await user.addRule((True, ("node",)))
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                al4.alerts.sync --help
+                """
+                msgs = await asuser.storm(q).list()
+                self.stormIsInPrint(
+                    "Model the analysis results of the Assemblyline submissions alerted on since the last sync.",
+                    msgs,
+                )
+
+
+class Command_Security_AL4_BACKFILL_Tests(t_utils.TestUtils):
+    async def test_run_command_with_no_perms_raises_AuthDeny(self):
+        """
+        Run the command and verify Raises AuthDeny for a user that does not have permissions.
+        i.e. user must be a member of power-ups.al4.user
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await core.auth.addUser("user")
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                al4.backfill
+                """
+                await self.asyncraises(s_exc.AuthDeny, asuser.callStorm(q))
+
+    async def test_run_command_with_perms_succeeds(self):
+        """
+        Run the command and verify the --help message works for a user that has perms.
+        i.e. user must be a member of power-ups.al4.user
+        """
+        async with self.getTestCoreWithPkg() as core:
+            user = await core.auth.addUser("user")
+            await user.addRule((True, ("power-ups", "al4", "user")))
+            await user.addRule((True, ("node",)))
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                al4.backfill --help
+                """
+                msgs = await asuser.storm(q).list()
+                self.stormIsInPrint(
+                    "Model the analysis results of the Assemblyline submissions completed within a time range.",
+                    msgs,
+                )
+
+
+class Command_Security_AL4_CACHE_PURGE_Tests(t_utils.TestUtils):
+    async def test_run_command_with_no_perms_raises_AuthDeny(self):
+        """
+        Run the command and verify Raises AuthDeny for a user that does not have permissions.
+        i.e. user must be a member of power-ups.al4.admin
+        """
+        async with self.getTestCoreWithPkg() as core:
+            user = await core.auth.addUser("user")
+            await user.addRule((True, ("power-ups", "al4", "user")))
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                al4.cache.purge --all
+                """
+                await self.asyncraises(s_exc.AuthDeny, asuser.callStorm(q))
+
+    async def test_run_command_with_perms_succeeds(self):
+        """
+        Run the command and verify the --help message works for a user that has perms.
+        i.e. user must be a member of power-ups.al4.admin
+        """
+        async with self.getTestCoreWithPkg() as core:
+            user = await core.auth.addUser("user")
+            await user.addRule((True, ("power-ups", "al4", "admin")))
+            await user.addRule((True, ("node",)))
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                al4.cache.purge --help
+                """
+                msgs = await asuser.storm(q).list()
+                self.stormIsInPrint("Delete entries from the Assemblyline results caches.", msgs)
+
+
+class Command_Security_AL4_CACHE_STATS_Tests(t_utils.TestUtils):
+    async def test_run_command_with_no_perms_raises_AuthDeny(self):
+        """
+        Run the command and verify Raises AuthDeny for a user that does not have permissions.
+        i.e. user must be a member of power-ups.al4.user
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await core.auth.addUser("user")
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                al4.cache.stats
+                """
+                await self.asyncraises(s_exc.AuthDeny, asuser.callStorm(q))
+
+    async def test_run_command_with_perms_succeeds(self):
+        """
+        Run the command and verify the --help message works for a user that has perms.
+        i.e. user must be a member of power-ups.al4.user
+        """
+        async with self.getTestCoreWithPkg() as core:
+            user = await core.auth.addUser("user")
+            await user.addRule((True, ("power-ups", "al4", "user")))
+            await user.addRule((True, ("node",)))
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                al4.cache.stats --help
+                """
+                msgs = await asuser.storm(q).list()
+                self.stormIsInPrint("Show the size, age, and hit ratio of the Assemblyline results caches.", msgs)
+
+
+class Command_Security_AL4_CACHE_WARM_Tests(t_utils.TestUtils):
+    async def test_run_command_with_no_perms_raises_AuthDeny(self):
+        """
+        Run the command and verify Raises AuthDeny for a user that does not have permissions.
+        i.e. user must be a member of power-ups.al4.user
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await core.auth.addUser("user")
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                al4.cache.warm
+                """
+                await self.asyncraises(s_exc.AuthDeny, asuser.callStorm(q))
+
+    async def test_run_command_with_perms_succeeds(self):
+        """
+        Run the command and verify the --help message works for a user that has perms.
+        i.e. user must be a member of power-ups.al4.user
+        """
+        async with self.getTestCoreWithPkg() as core:
+            user = await core.auth.addUser("user")
+            await user.addRule((True, ("power-ups", "al4", "user")))
+            await user.addRule((True, ("node",)))
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                al4.cache.warm --help
+                """
+                msgs = await asuser.storm(q).list()
+                self.stormIsInPrint(
+                    "Prefetch the Assemblyline analytic results of the specified files into the cache without modeling them.",
+                    msgs,
+                )
+
+
 class Command_Security_AL4_FILE_DOWNLOAD_Tests(t_utils.TestUtils):
     async def test_run_command_with_no_perms_raises_AuthDeny(self):
         """
@@ -284,6 +459,42 @@ class Command_Security_AL4_SETUP_PROXY_Tests(t_utils.TestUtils):
                 )
 
 
+class Command_Security_AL4_SETUP_RATELIMIT_Tests(t_utils.TestUtils):
+    async def test_run_command_with_no_perms_raises_AuthDeny(self):
+        """
+        Run the command and verify Raises AuthDeny for a user that does not have permissions.
+        i.e. user must be a member of power-ups.al4.admin
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await core.auth.addUser("user")
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                al4.setup.ratelimit
+                """
+                await self.asyncraises(s_exc.AuthDeny, asuser.callStorm(q))
+
+    async def test_run_command_with_perms_succeeds(self):
+        """
+        Run the command and verify the --help message works for a user that has perms.
+        i.e. user must be a member of power-ups.al4.admin
+        """
+        async with self.getTestCoreWithPkg() as core:
+            user = await core.auth.addUser("user")
+            await user.addRule((True, ("power-ups", "al4", "admin")))
+            await user.addRule((True, ("node",)))
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                al4.setup.ratelimit --help
+                """
+                msgs = await asuser.storm(q).list()
+                self.stormIsInPrint(
+                    "Limit the rate of the Assemblyline API calls made by all users of the Power-Up.",
+                    msgs,
+                )
+
+
 class Command_Security_AL4_SETUP_TAGPREFIX_Tests(t_utils.TestUtils):
     async def test_run_command_with_no_perms_raises_AuthDeny(self):
         """
@@ -355,6 +566,78 @@ class Command_Security_AL4_SUBMISSION_ENRICH_Tests(t_utils.TestUtils):
                 )
 
 
+class Command_Security_AL4_SUBMISSION_SYNC_Tests(t_utils.TestUtils):
+    async def test_run_command_with_no_perms_raises_AuthDeny(self):
+        """
+        Run the command and verify Raises AuthDeny for a user that does not have permissions.
+        i.e. user must be a member of power-ups.al4.user
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await core.auth.addUser("user")
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                al4.submission.sync
+                """
+                await self.asyncraises(s_exc.AuthDeny, asuser.callStorm(q))
+
+    async def test_run_command_with_perms_succeeds(self):
+        """
+        Run the command and verify the --help message works for a user that has perms.
+        i.e. user must be a member of power-ups.al4.user
+        """
+        async with self.getTestCoreWithPkg() as core:
+            user = await core.auth.addUser("user")
+            await user.addRule((True, ("power-ups", "al4", "user")))
+            await user.addRule((True, ("node",)))
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                al4.submission.sync --help
+                """
+                msgs = await asuser.storm(q).list()
+                self.stormIsInPrint(
+                    "Model the analysis results of the Assemblyline submissions completed since the last sync.",
+                    msgs,
+                )
+
+
+class Command_Security_AL4_SUBMISSION_TRACK_Tests(t_utils.TestUtils):
+    async def test_run_command_with_no_perms_raises_AuthDeny(self):
+        """
+        Run the command and verify Raises AuthDeny for a user that does not have permissions.
+        i.e. user must be a member of power-ups.al4.user
+        """
+        async with self.getTestCoreWithPkg() as core:
+            await core.auth.addUser("user")
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                al4.submission.track
+                """
+                await self.asyncraises(s_exc.AuthDeny, asuser.callStorm(q))
+
+    async def test_run_command_with_perms_succeeds(self):
+        """
+        Run the command and verify the --help message works for a user that has perms.
+        i.e. user must be a member of power-ups.al4.user
+        """
+        async with self.getTestCoreWithPkg() as core:
+            user = await core.auth.addUser("user")
+            await user.addRule((True, ("power-ups", "al4", "user")))
+            await user.addRule((True, ("node",)))
+
+            async with core.getLocalProxy(user="user") as asuser:
+                q = """
+                al4.submission.track --help
+                """
+                msgs = await asuser.storm(q).list()
+                self.stormIsInPrint(
+                    "Model the analysis results of the submissions queued with the --track option once Assemblyline completes them.",
+                    msgs,
+                )
+
+
 class Command_Security_AL4_URL_SUBMIT_Tests(t_utils.TestUtils):
     async def test_run_command_with_no_perms_raises_AuthDeny(self):
         """